@@ -0,0 +1,31 @@
+"""add notification indexes
+
+Revision ID: 3c1f9a7d2b40
+Revises: e2ad1366e3cd
+Create Date: 2026-10-16 01:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a7d2b40'
+down_revision: Union[str, Sequence[str], None] = 'e2ad1366e3cd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # if_not_exists: pe baze create cu create_all (AUTO_CREATE_TABLES) index-ul există deja
+    op.create_index("ix_notifications_user_id_created_at", "notifications", ["user_id", "created_at"], if_not_exists=True)
+    op.create_index("ix_notifications_user_id_is_read", "notifications", ["user_id", "is_read"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notifications_user_id_is_read", table_name="notifications", if_exists=True)
+    op.drop_index("ix_notifications_user_id_created_at", table_name="notifications", if_exists=True)
@@ -0,0 +1,29 @@
+"""add tasks project_id created_at index
+
+Revision ID: 7b5e2c8a9d13
+Revises: 3c1f9a7d2b40
+Create Date: 2026-10-16 02:35:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b5e2c8a9d13'
+down_revision: Union[str, Sequence[str], None] = '3c1f9a7d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # if_not_exists: pe baze create cu create_all (AUTO_CREATE_TABLES) index-ul există deja
+    op.create_index("ix_tasks_project_id_created_at", "tasks", ["project_id", "created_at"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tasks_project_id_created_at", table_name="tasks", if_exists=True)
@@ -0,0 +1,29 @@
+"""add projects user_id created_at index
+
+Revision ID: a9d4e6f1c872
+Revises: 7b5e2c8a9d13
+Create Date: 2026-10-16 03:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e6f1c872'
+down_revision: Union[str, Sequence[str], None] = '7b5e2c8a9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # if_not_exists: pe baze create cu create_all (AUTO_CREATE_TABLES) index-ul există deja
+    op.create_index("ix_projects_user_id_created_at", "projects", ["user_id", "created_at"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_projects_user_id_created_at", table_name="projects", if_exists=True)
@@ -1,16 +1,23 @@
 # backend/auth/auth_router.py
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.context import CryptContext
-from datetime import datetime, timedelta, timezone
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import AfterValidator, BaseModel, field_validator
 from sqlalchemy.orm import Session
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, select
 from dotenv import load_dotenv
+from typing import Annotated
+import atexit
+import logging
 import os
+import queue
 import re
+import time
+from logging.handlers import QueueHandler, QueueListener
+import bcrypt
 
 # ================= ENV =================
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", ".env"))
@@ -20,17 +27,36 @@ ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 RESET_TOKEN_EXPIRE_MINUTES = int(os.getenv("RESET_TOKEN_EXPIRE_MINUTES", "15"))
 FRONTEND_BASE_URL = os.getenv("FRONTEND_BASE_URL", "http://localhost:5173")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 if not SECRET_KEY:
     raise RuntimeError("SECRET_KEY missing in .env!")
 
 # ================= SECURITY =================
 router = APIRouter(tags=["auth"])
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# ================= LOGGING =================
+# Handler-ul doar pune record-ul în coadă; scrierea pe stderr se face pe thread-ul listener-ului,
+# deci request-ul nu așteaptă după flush.
+logger = logging.getLogger("backend.auth")
+if not logger.handlers:
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 # ================= DATABASE =================
-from backend.database import Base, engine, SessionLocal
+from backend.database import Base, SessionLocal
 
 
 class User(Base):
@@ -42,8 +68,6 @@ class User(Base):
     is_active = Column(Boolean, default=True)
 
 
-Base.metadata.create_all(bind=engine)
-
 
 def get_db():
     db = SessionLocal()
@@ -54,21 +78,25 @@ def get_db():
 
 
 # ================= HELPERS =================
+# bcrypt direct (fără dispatch-ul passlib); passlib rămâne doar pentru needs_update
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    try:
+        return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+    except ValueError:
+        return False
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
 
 
 def create_access_token(sub: str, minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES):
-    exp = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    exp = int(time.time()) + minutes * 60
     return jwt.encode({"sub": sub, "exp": exp}, SECRET_KEY, algorithm=ALGORITHM)
 
 
 def create_password_reset_token(user_id: int):
-    exp = datetime.now(timezone.utc) + timedelta(minutes=RESET_TOKEN_EXPIRE_MINUTES)
+    exp = int(time.time()) + RESET_TOKEN_EXPIRE_MINUTES * 60
     return jwt.encode(
         {"sub": str(user_id), "exp": exp, "type": "pwd_reset"},
         SECRET_KEY,
@@ -76,6 +104,35 @@ def create_password_reset_token(user_id: int):
     )
 
 
+# token -> (user_id, exp). Payload-ul unui JWT nu se schimbă până la exp,
+# deci putem sări peste HMAC + JSON la request-urile repetate.
+_TOKEN_CACHE: dict[str, tuple[int, float]] = {}
+_TOKEN_CACHE_MAX = 10000
+
+
+def decode_access_token(token: str) -> int:
+    hit = _TOKEN_CACHE.get(token)
+    if hit is not None and hit[1] > time.time():
+        return hit[0]
+
+    try:
+        data = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id = int(data["sub"])
+    except JWTError:
+        _TOKEN_CACHE.pop(token, None)
+        raise HTTPException(401, "Invalid or expired token")
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(401, "Invalid token payload")
+
+    exp = data.get("exp")
+    if isinstance(exp, (int, float)):
+        if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+            _TOKEN_CACHE.clear()
+        _TOKEN_CACHE[token] = (user_id, float(exp))
+
+    return user_id
+
+
 def decode_password_reset_token(token: str) -> int:
     try:
         data = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -86,23 +143,80 @@ def decode_password_reset_token(token: str) -> int:
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
 
 
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+
+
+def _check_email(value: str) -> str:
+    """
+    Validare email cu un singur regex precompilat (în loc de email-validator).
+    Domeniul e trecut la lowercase, ca la EmailStr, ca lookup-ul după email să rămână la fel.
+    """
+    value = value.strip()
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+Email = Annotated[str, AfterValidator(_check_email)]
+
+
+_ASCII_ALNUM = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _check_password_strength(value: str) -> str:
+    """
+    Validare parolă într-un singur pass (fără regex).
+    Reguli: min 8 caractere, o majusculă A-Z, o cifră, un simbol (non A-Za-z0-9).
+    """
+    if len(value) < 8:
+        raise ValueError("Password must be at least 8 chars")
+
+    has_upper = has_digit = has_symbol = False
+    for ch in value:
+        if "A" <= ch <= "Z":
+            has_upper = True
+        elif ch.isdecimal():
+            has_digit = True
+            if ch not in _ASCII_ALNUM:
+                has_symbol = True
+        elif ch not in _ASCII_ALNUM:
+            has_symbol = True
+
+    if not has_upper:
+        raise ValueError("Must contain uppercase")
+    if not has_digit:
+        raise ValueError("Must contain number")
+    if not has_symbol:
+        raise ValueError("Must contain symbol")
+    return value
+
+
+# Rutele async (register/login/reset) rulează DB + bcrypt în threadpool,
+# ca event loop-ul să nu fie blocat de hash-ul bcrypt.
+def _email_exists(db: Session, email: str) -> bool:
+    return db.execute(select(User.id).where(User.email == email).limit(1)).first() is not None
+
+
+def _get_user_by_email(db: Session, email: str):
+    return db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+
+
+def _save_user(db: Session, user: User) -> None:
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+
 # ================= SCHEMAS =================
 class RegisterRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
     confirm_password: str
 
     @field_validator("password")
     def validate_password(cls, value):
-        if len(value) < 8:
-            raise ValueError("Password must be at least 8 chars")
-        if not re.search(r"[A-Z]", value):
-            raise ValueError("Must contain uppercase")
-        if not re.search(r"\d", value):
-            raise ValueError("Must contain number")
-        if not re.search(r"[^A-Za-z0-9]", value):
-            raise ValueError("Must contain symbol")
-        return value
+        return _check_password_strength(value)
 
     @field_validator("confirm_password")
     def passwords_match(cls, v, info):
@@ -112,12 +226,12 @@ class RegisterRequest(BaseModel):
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    email: Email
 
 
 class ResetPasswordRequest(BaseModel):
@@ -127,15 +241,7 @@ class ResetPasswordRequest(BaseModel):
 
     @field_validator("new_password")
     def validate_password(cls, value):
-        if len(value) < 8:
-            raise ValueError("Password must be at least 8 chars")
-        if not re.search(r"[A-Z]", value):
-            raise ValueError("Must contain uppercase")
-        if not re.search(r"\d", value):
-            raise ValueError("Must contain number")
-        if not re.search(r"[^A-Za-z0-9]", value):
-            raise ValueError("Must contain symbol")
-        return value
+        return _check_password_strength(value)
 
     @field_validator("confirm_password")
     def passwords_match(cls, v, info):
@@ -146,29 +252,32 @@ class ResetPasswordRequest(BaseModel):
 
 # ================= ROUTES =================
 @router.post("/register", status_code=201)
-def register_user(request: RegisterRequest, db: Session = Depends(get_db)):
-    exists = db.query(User).filter(User.email == request.email).first()
+async def register_user(request: RegisterRequest, db: Session = Depends(get_db)):
+    exists = await run_in_threadpool(_email_exists, db, request.email)
     if exists:
         raise HTTPException(400, "Email already registered")
 
     user = User(
         email=request.email,
-        password_hash=hash_password(request.password),
+        password_hash=await run_in_threadpool(hash_password, request.password),
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_in_threadpool(_save_user, db, user)
 
     return {"message": "User registered", "email": user.email}
 
 
 @router.post("/login")
-def login(request: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == request.email).first()
+async def login(request: LoginRequest, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(_get_user_by_email, db, request.email)
 
-    if not user or not verify_password(request.password, user.password_hash):
+    if not user or not await run_in_threadpool(verify_password, request.password, user.password_hash):
         raise HTTPException(401, "Invalid credentials")
 
+    # hash-urile cu cost sub BCRYPT_ROUNDS sunt refăcute la primul login reușit
+    if pwd_context.needs_update(user.password_hash):
+        user.password_hash = await run_in_threadpool(hash_password, request.password)
+        await run_in_threadpool(db.commit)
+
     token = create_access_token(str(user.id))
     return {"access_token": token, "token_type": "bearer"}
 
@@ -178,13 +287,9 @@ def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ):
-    try:
-        data = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = int(data["sub"])
-    except JWTError:
-        raise HTTPException(401, "Invalid or expired token")
+    user_id = decode_access_token(token)
 
-    user = db.query(User).get(user_id)
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(404, "User not found")
 
@@ -201,7 +306,7 @@ def forgot_password(
     - Răspuns identic indiferent dacă email-ul există
     - Anti user-enumeration
     """
-    user = db.query(User).filter(User.email == req.email).first()
+    user = _get_user_by_email(db, req.email)
 
     response = {"message": "If the email exists, a reset link was sent."}
 
@@ -212,23 +317,27 @@ def forgot_password(
     reset_link = f"{FRONTEND_BASE_URL}/reset-password?token={token}"
 
     # Placeholder pentru email real
-    print(f"[PASSWORD RESET LINK] {user.email}: {reset_link}")
+    logger.info("[PASSWORD RESET LINK] %s: %s", user.email, reset_link)
 
     return response
 
 
 @router.post("/reset-password")
-def reset_password(
+async def reset_password(
     req: ResetPasswordRequest,
     db: Session = Depends(get_db),
 ):
     user_id = decode_password_reset_token(req.token)
 
-    user = db.query(User).get(user_id)
+    user = await run_in_threadpool(db.get, User, user_id)
     if not user:
         raise HTTPException(404, "User not found")
 
-    user.password_hash = hash_password(req.new_password)
-    db.commit()
+    # aceeași parolă -> nu mai refacem hash-ul (verify costă cât un hash)
+    if await run_in_threadpool(verify_password, req.new_password, user.password_hash):
+        return {"message": "Password unchanged"}
+
+    user.password_hash = await run_in_threadpool(hash_password, req.new_password)
+    await run_in_threadpool(db.commit)
 
     return {"message": "Password updated successfully"}
@@ -1,23 +1,15 @@
 from fastapi import Depends, HTTPException, status
-from jose import jwt, JWTError
 from sqlalchemy.orm import Session
-from .auth_router import SECRET_KEY, ALGORITHM, get_db, User, oauth2_scheme
+from .auth_router import decode_access_token, get_db, User, oauth2_scheme
 
 # validează tokenul și returnează utilizatorul curent
 def get_current_user_from_token(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ):
+    user_id = decode_access_token(token)
 
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-    except JWTError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
-
-    user = db.query(User).get(int(user_id))
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
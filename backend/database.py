@@ -1,5 +1,5 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 
@@ -14,12 +14,47 @@ connect_args = {}
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
+# SQL logs only when explicitly requested (SQL_ECHO=true), they are expensive per query
+SQL_ECHO = os.getenv("SQL_ECHO", "false").strip().lower() == "true"
+
+# Connection pool (reused across requests instead of opening a connection per request)
+pool_kwargs = {}
+_sqlite_memory = DATABASE_URL in ("sqlite://", "sqlite:///:memory:")
+if not _sqlite_memory:  # in-memory SQLite uses SingletonThreadPool (no pool sizing)
+    # SQLite file: one writer at a time anyway, and every connection keeps its own page cache
+    # (see cache_size below) -> smaller pool than for server DBs
+    _sqlite_file = DATABASE_URL.startswith("sqlite")
+    pool_kwargs["pool_size"] = int(os.getenv("DB_POOL_SIZE", "5" if _sqlite_file else "10"))
+    pool_kwargs["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "5" if _sqlite_file else "20"))
+    # fail fast when the pool is exhausted instead of holding the worker for the default 30s
+    pool_kwargs["pool_timeout"] = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+if not DATABASE_URL.startswith("sqlite"):
+    # server DBs: drop idle connections before the server does, reuse the warmest one first
+    pool_kwargs["pool_recycle"] = 1800
+    pool_kwargs["pool_use_lifo"] = True
+
 engine = create_engine(
     DATABASE_URL,
     connect_args=connect_args,
-    echo=True,  # show SQL logs
+    echo=SQL_ECHO,
+    **pool_kwargs,
 )
 
+if DATABASE_URL.startswith("sqlite"):
+    # WAL: readers don't wait for writers; NORMAL sync = one WAL append per commit
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        # page cache is per connection (negative = KiB, default ~2 MB): ~16 MB each, so the worst case
+        # with the default pool (5 + 5 overflow) is 10 x 16 MB = ~160 MB, plus the 256 MB mmap above
+        # (shared by all connections, backed by the OS page cache)
+        cursor.execute("PRAGMA cache_size=-16000")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
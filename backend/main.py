@@ -1,9 +1,11 @@
 # backend/main.py
 
 import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 load_dotenv(
@@ -12,7 +14,30 @@ load_dotenv(
     encoding="utf-8-sig",
 )
 
-app = FastAPI(title="Proiect Colectiv AI Backend")
+
+def _init_db() -> None:
+    # Creează tabelele o singură dată, la pornire (pentru SQLite dev).
+    # Cu migrări reale (Alembic / prod): AUTO_CREATE_TABLES=false și nu mai rulează niciun DDL aici.
+    # (Base / engine / SessionLocal sunt importate mai jos, înainte de pornire)
+    if os.getenv("AUTO_CREATE_TABLES", "true").strip().lower() != "true":
+        return
+
+    # create_all nu adaugă index-uri noi pe tabele care există deja (app.db vechi):
+    # pentru acelea rulează `alembic upgrade head` (backend/alembic/versions).
+    Base.metadata.create_all(bind=engine)
+
+    # DEV MIGRATION (SQLite): projects.user_id, o dată la pornire în loc de per request
+    with SessionLocal() as db:
+        ensure_projects_user_id_column(db)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(_init_db)
+    yield
+
+
+app = FastAPI(title="Proiect Colectiv AI Backend", lifespan=lifespan)
 
 # ---------------- CORS ----------------
 origins = [
@@ -34,18 +59,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # ---------------- DATABASE + ROUTERS ----------------
-from backend.database import Base, engine  # noqa: E402
+from backend.database import Base, SessionLocal, engine  # noqa: E402
 
 # IMPORTANT:
 # Importăm router-ele DUPĂ ce app e creat (cum ai deja),
-# dar și modelele trebuie să fie importate înainte de create_all()
+# dar și modelele trebuie să fie importate înainte de create_all() (din lifespan)
 # ca să existe în Base.metadata.
 
 from backend.auth.auth_router import router as auth_router  # noqa: E402
 from backend.project.project_router import router as project_router  # noqa: E402
+from backend.project.project_router import ensure_projects_user_id_column  # noqa: E402
 from backend.task.task_router import router as task_router  # noqa: E402
 
 # ✅ Notifications router (NEW)
@@ -55,9 +82,6 @@ from backend.notification.notification_router import router as notification_rout
 # (nu e obligatoriu dacă sunt importate indirect în router, dar e mai sigur)
 from backend.models.notification import Notification  # noqa: F401, E402
 
-# Creează tabelele (pentru SQLite dev). Dacă folosiți Alembic strict, comentați.
-Base.metadata.create_all(bind=engine)
-
 # ---------------- ROUTERS ----------------
 # auth_router NU are prefix intern, deci îl setăm aici:
 app.include_router(auth_router, prefix="/auth")
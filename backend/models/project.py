@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func
 from backend.database import Base
 
 
@@ -29,4 +29,9 @@ class Project(Base):
     members_count = Column(Integer, default=0, nullable=False)
 
     start_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
+
+    # GET /projects: WHERE user_id = ? ORDER BY created_at DESC (index-ul e parcurs invers, fără sort)
+    __table_args__ = (
+        Index("ix_projects_user_id_created_at", "user_id", "created_at"),
+    )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index, func
 from backend.database import Base
 
 
@@ -30,5 +30,10 @@ class Task(Base):
 
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # summary-ul de proiect: WHERE project_id = ? ORDER BY created_at LIMIT n -> range scan, fără sort
+    __table_args__ = (
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at"),
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update
 
 from backend.auth.auth_router import get_db
 from backend.models.notification import Notification
@@ -27,23 +27,23 @@ def list_notifications(
     db: Session = Depends(get_db),
 ):
     _require_user_id(user_id)
-    q = (
-        db.query(Notification)
-        .filter(Notification.user_id == user_id)
+    stmt = (
+        select(Notification)
+        .where(Notification.user_id == user_id)
         .order_by(Notification.created_at.desc())
         .limit(limit)
     )
-    return q.all()
+    return db.execute(stmt).scalars().all()
 
 
 @router.get("/unread_count")
 def unread_count(user_id: int | None = None, db: Session = Depends(get_db)):
     _require_user_id(user_id)
-    count = (
-        db.query(func.count(Notification.id))
-        .filter(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
-        .scalar()
-    )
+    count = db.execute(
+        select(func.count(Notification.id)).where(
+            Notification.user_id == user_id, Notification.is_read.is_(False)
+        )
+    ).scalar()
     return {"unread": int(count or 0)}
 
 
@@ -74,8 +74,12 @@ def mark_read(notification_id: int, user_id: int | None = None, db: Session = De
 def mark_all_read(user_id: int | None = None, db: Session = Depends(get_db)):
     _require_user_id(user_id)
 
-    db.query(Notification).filter(Notification.user_id == user_id, Notification.is_read == False).update(  # noqa: E712
-        {"is_read": True}
+    # UPDATE direct în DB, fără să sincronizăm obiectele din sesiune
+    db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read.is_(False))
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
     )
     db.commit()
     return {"ok": True}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 
 from backend.models.notification import Notification
@@ -26,4 +27,33 @@ def create_notification(
     db.add(n)
     db.commit()
     db.refresh(n)
-    return n
\ No newline at end of file
+    return n
+
+
+# ------------------------------------------------------------
+# Notificări amânate până la commit
+# - queue_notification() doar adaugă un dict în sesiune (session.info)
+# - la commit, toate se scriu cu un singur INSERT (executemany)
+# - la rollback se aruncă, la fel ca restul modificărilor din tranzacție
+# ------------------------------------------------------------
+_PENDING_KEY = "pending_notifications"
+
+
+def queue_notification(db: Session, **values: Any) -> None:
+    db.info.setdefault(_PENDING_KEY, []).append(values)
+
+
+def queue_notifications(db: Session, rows: List[Dict[str, Any]]) -> None:
+    db.info.setdefault(_PENDING_KEY, []).extend(rows)
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_pending_notifications(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        session.execute(insert(Notification), rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_notifications(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
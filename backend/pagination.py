@@ -0,0 +1,66 @@
+# backend/pagination.py
+"""
+Keyset pagination pentru endpoint-urile de listă (opt-in: ?limit=&cursor=).
+
+Fără `limit` listele rămân complete, ca înainte (frontend-ul citește lista întreagă).
+Cu `limit`, răspunsul are cel mult `limit` elemente și, dacă mai sunt, header-ul
+X-Next-Cursor cu valoarea de trimis ca `cursor` la pagina următoare.
+Cursorul e (created_at, id) al ultimului element, deci pagina următoare e un range scan
+pe index-ul (…, created_at), fără OFFSET.
+
+created_at poate fi NULL (rânduri create înainte de server_default): grupul NULL vine primul
+în ambele direcții, iar în cursor apare gol ("_<id>"). Așa, după primul rând cu dată, filtrul
+rămâne o comparație simplă pe (created_at, id), adică tot range scan pe index.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    return f"{created_at.isoformat() if created_at is not None else ''}_{row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    created_at, sep, row_id = cursor.rpartition("_")
+    if not sep:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    try:
+        return (datetime.fromisoformat(created_at) if created_at else None), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_order_by(created_col: Any, id_col: Any, descending: bool) -> Tuple[Any, Any]:
+    """ORDER BY created_at, id cu NULL-urile explicit primele (la fel pe SQLite și Postgres)."""
+    if descending:
+        return created_col.desc().nulls_first(), id_col.desc()
+    return created_col.asc().nulls_first(), id_col.asc()
+
+
+def keyset_filter(created_col: Any, id_col: Any, cursor: str, descending: bool):
+    """WHERE (created_at, id) < / > cursor, în aceeași ordine ca keyset_order_by."""
+    created_at, row_id = decode_cursor(cursor)
+    if created_at is None:
+        # încă în grupul NULL (ordonat doar după id), apoi toate rândurile cu dată
+        in_null_group = and_(created_col.is_(None), id_col < row_id if descending else id_col > row_id)
+        return or_(in_null_group, created_col.is_not(None))
+
+    # grupul NULL a fost deja parcurs; comparația pe tuplu exclude oricum NULL-urile
+    key = tuple_(created_col, id_col)
+    return key < (created_at, row_id) if descending else key > (created_at, row_id)
+
+
+def next_cursor_headers(rows: Sequence[Any], limit: Optional[int]) -> Dict[str, str]:
+    """Header-ul X-Next-Cursor doar dacă pagina e plină (poate mai urmează rânduri)."""
+    if limit is None or len(rows) < limit:
+        return {}
+    last = rows[-1]
+    return {NEXT_CURSOR_HEADER: encode_cursor(last.created_at, last.id)}
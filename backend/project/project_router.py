@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import operator
 import os
-from datetime import datetime
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import and_, bindparam, insert, select, text, update
+from sqlalchemy.orm import Session, load_only
+from starlette.background import BackgroundTask
 
 from backend.auth.auth_router import get_db
-from backend.models.notification import Notification
+from backend.database import SessionLocal
+from backend.pagination import MAX_PAGE_SIZE, keyset_filter, keyset_order_by, next_cursor_headers
+from backend.sse import SSE_HEADERS, SSE_MEDIA_TYPE, sse_event
 from backend.models.project import Project
 from backend.models.task import Task
+from backend.notification.notification_service import queue_notification
 from backend.schemas.project_schema import ProjectCreate, ProjectRead, ProjectUpdate
+from backend.schemas.task_schema import ProjectSummaryResponse
 from backend.task.ai_service import (
     AIService,
     AIServiceError,
@@ -22,15 +34,23 @@ from backend.task.ai_service import (
     AIServiceTimeoutError,
 )
 
+try:
+    import xxhash  # optional: faster ETag hashing
+except Exception:
+    xxhash = None  # type: ignore
+
 logger = logging.getLogger("backend.project")
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# citit o singură dată (main.py încarcă .env înainte de import-ul router-elor)
+_AI_ENABLED = os.getenv("AI_ENABLED", "false").strip().lower() == "true"
+
 
 # ==========================
 # Helpers
 # ==========================
 def _ai_enabled_or_503() -> None:
-    if os.getenv("AI_ENABLED", "false").strip().lower() != "true":
+    if not _AI_ENABLED:
         raise HTTPException(
             status_code=503,
             detail="AI functionality is disabled (set AI_ENABLED=true)",
@@ -59,19 +79,42 @@ def _get_user_id(request: Request) -> int:
     raise HTTPException(status_code=401, detail="Missing user identity (X-User-Id or auth)")
 
 
-def _tasks_to_text(tasks: List[Task], max_tasks: int = 60) -> str:
-    lines: List[str] = []
-    for t in tasks[:max_tasks]:
-        sp = t.estimated_story_points if t.estimated_story_points is not None else "-"
-        desc = (t.description or "").strip().replace("\n", " ")
-        if len(desc) > 240:
-            desc = desc[:240] + "..."
-        lines.append(
-            f"- {t.title} | status={t.status} | priority={t.priority} | "
-            f"complexity={t.complexity} | sp={sp} | assignee={t.assignee or '-'} | "
-            f"tags={t.tags or '-'} | desc={desc}"
-        )
-    return "\n".join(lines).strip()
+_NEWLINES_TO_SPACE = str.maketrans({"\n": " ", "\r": " "})
+
+
+# câte task-uri intră în prompt-ul de summary (aplicat ca LIMIT în SQL)
+_SUMMARY_MAX_TASKS = 60
+
+
+_TASK_FMT = (
+    "- {title} | status={status} | priority={priority} | "
+    "complexity={complexity} | sp={sp} | assignee={assignee} | "
+    "tags={tags} | desc={desc}"
+)
+_TASK_FIELDS = operator.attrgetter(
+    "title", "status", "priority", "complexity",
+    "estimated_story_points", "assignee", "tags", "description",
+)
+
+
+def _task_line(title, status, priority, complexity, sp, assignee, tags, description) -> str:
+    desc = (description or "").translate(_NEWLINES_TO_SPACE).strip()
+    if len(desc) > 240:
+        desc = desc[:240] + "..."
+    return _TASK_FMT.format(
+        title=title,
+        status=status,
+        priority=priority,
+        complexity=complexity,
+        sp=sp if sp is not None else "-",
+        assignee=assignee or "-",
+        tags=tags or "-",
+        desc=desc,
+    )
+
+
+def _tasks_to_text(tasks: List[Task]) -> str:
+    return "\n".join(_task_line(*_TASK_FIELDS(t)) for t in tasks).strip()
 
 
 def _notify(
@@ -84,39 +127,47 @@ def _notify(
     project_id: Optional[int] = None,
     task_id: Optional[int] = None,
 ) -> None:
-    try:
-        n = Notification(
-            user_id=user_id,
-            type=ntype,
-            title=title,
-            message=message,
-            is_read=False,
-            created_at=datetime.utcnow(),
-            project_id=project_id,
-            task_id=task_id,
-        )
-        db.add(n)
-    except Exception:
-        logger.exception(
-            "notification_create_failed",
-            extra={"type": ntype, "project_id": project_id, "task_id": task_id, "user_id": user_id},
-        )
+    # doar pune notificarea în coadă; INSERT-ul (unul pentru toate) se face la commit
+    queue_notification(
+        db,
+        user_id=user_id,
+        type=ntype,
+        title=title,
+        message=message,
+        is_read=False,
+        project_id=project_id,
+        task_id=task_id,
+    )
 
 
 # ==========================
 # ✅ DEV MIGRATION: ensure projects.user_id exists
 # ==========================
-def _ensure_projects_user_id_column(db: Session) -> None:
+_schema_checked = False
+
+
+def ensure_projects_user_id_column(db: Session) -> None:
     """
     Fix pentru SQLite dev:
     - dacă tabela projects NU are user_id, o adăugăm.
     - folosim DEFAULT 1 ca să nu fie NULL la rândurile existente.
+    Rulează o singură dată, la pornire (lifespan din main.py), nu per request;
+    apelurile ulterioare din același proces ies imediat.
     """
+    global _schema_checked
+    if _schema_checked:
+        return
+
+    if db.get_bind().dialect.name != "sqlite":
+        _schema_checked = True
+        return
+
     try:
         cols = db.execute(text("PRAGMA table_info(projects)")).fetchall()
         col_names = {row[1] for row in cols}
 
         if "user_id" in col_names:
+            _schema_checked = True
             return
 
         logger.warning("DEV MIGRATION: adding projects.user_id column (SQLite)")
@@ -126,14 +177,106 @@ def _ensure_projects_user_id_column(db: Session) -> None:
 
         db.commit()
         logger.warning("DEV MIGRATION: projects.user_id added with DEFAULT 1")
+        _schema_checked = True
     except Exception:
         db.rollback()
         logger.exception("DEV MIGRATION failed: could not ensure projects.user_id")
-        raise HTTPException(status_code=500, detail="Database migration failed for projects.user_id")
+        raise
+
+
+# hash pentru ETag (nu e folosit pentru securitate): xxh3 dacă e instalat, altfel blake2b
+if xxhash is not None:
+    def _body_hash(body: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(body)
+else:
+    def _body_hash(body: bytes) -> str:
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectRead])
+_PROJECT_READ_COLUMNS = (
+    Project.id,
+    Project.name,
+    Project.description,
+    Project.tech_stack,
+    Project.infrastructure,
+    Project.members_count,
+    Project.start_date,
+    Project.created_at,
+)
 
+# statement-uri construite o singură dată (SQL-ul compilat e oricum în cache-ul engine-ului;
+# așa sărim și peste construirea Select-ului + cache key-ul la fiecare request)
+_SEL_PROJECT_LIST = (
+    select(*_PROJECT_READ_COLUMNS)
+    .where(Project.user_id == bindparam("uid"))
+    .order_by(Project.created_at.desc())
+)
+_SEL_PROJECT_READ = select(*_PROJECT_READ_COLUMNS).where(
+    Project.id == bindparam("pid"), Project.user_id == bindparam("uid")
+)
 
-def _get_owned_project(db: Session, project_id: int, user_id: int) -> Project:
-    project = db.get(Project, project_id)
+# Cache in-process pentru GET /projects: user_id -> (expires_at, body JSON).
+# Invalidat la create / update / delete. PROJECTS_CACHE_TTL=0 îl dezactivează.
+# (per proces: cu mai mulți workeri, alt worker poate servi lista veche până la TTL)
+_PROJECTS_CACHE_TTL = float(os.getenv("PROJECTS_CACHE_TTL", "30"))
+_PROJECT_LIST_CACHE: Dict[int, Tuple[float, bytes]] = {}
+_PROJECT_LIST_CACHE_MAX = 1000
+
+# Generație per user, crește la fiecare invalidare: un GET care a citit DB-ul înainte de o
+# scriere concurentă, dar termină după invalidare, nu mai pune lista veche în cache.
+# Valorile vin dintr-un contor global; la depășirea limitei dict-ul se golește, iar userii
+# fără intrare primesc "podeaua" (ultima valoare emisă), deci tot nu se potrivesc cu un GET vechi.
+_PROJECT_LIST_GEN: Dict[int, int] = {}
+_PROJECT_LIST_GEN_MAX = 10000
+_project_list_gen_seq = 0
+_project_list_gen_floor = 0
+_PROJECT_LIST_LOCK = threading.Lock()
+
+
+def _project_list_generation(user_id: int) -> int:
+    return _PROJECT_LIST_GEN.get(user_id, _project_list_gen_floor)
+
+
+def _invalidate_project_list(user_id: int) -> None:
+    global _project_list_gen_seq, _project_list_gen_floor
+    with _PROJECT_LIST_LOCK:
+        _project_list_gen_seq += 1
+        if len(_PROJECT_LIST_GEN) >= _PROJECT_LIST_GEN_MAX and user_id not in _PROJECT_LIST_GEN:
+            _PROJECT_LIST_GEN.clear()
+            _project_list_gen_floor = _project_list_gen_seq
+        _PROJECT_LIST_GEN[user_id] = _project_list_gen_seq
+        _PROJECT_LIST_CACHE.pop(user_id, None)
+
+
+def _store_project_list(user_id: int, generation: int, body: bytes) -> None:
+    with _PROJECT_LIST_LOCK:
+        if _project_list_generation(user_id) != generation:
+            return  # s-a modificat ceva între citire și acum; lista citită poate fi veche
+        if len(_PROJECT_LIST_CACHE) >= _PROJECT_LIST_CACHE_MAX and user_id not in _PROJECT_LIST_CACHE:
+            _PROJECT_LIST_CACHE.pop(next(iter(_PROJECT_LIST_CACHE)))
+        _PROJECT_LIST_CACHE[user_id] = (time.monotonic() + _PROJECTS_CACHE_TTL, body)
+
+
+def _etag_json_response(request: Request, body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    ETag = hash pe body-ul JSON. Dacă clientul are deja aceeași versiune
+    (If-None-Match), răspundem 304 fără body.
+    """
+    etag = f'"{_body_hash(body)}"'
+    headers = {**(headers or {}), "ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or f"W/{etag}" in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _get_owned_project(db: Session, project_id: int, user_id: int, for_update: bool = False) -> Project:
+    # for_update: SELECT ... FOR UPDATE când citim rândul ca să-l modificăm/ștergem în aceeași tranzacție
+    # (pe SQLite nu se emite; acolo tranzacția de scriere e oricum serializată)
+    project = db.get(Project, project_id, with_for_update=True if for_update else None)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
@@ -148,20 +291,14 @@ def _get_owned_project(db: Session, project_id: int, user_id: int) -> Project:
 # ==========================
 @router.post("/", response_model=ProjectRead)
 def create_project(data: ProjectCreate, request: Request, db: Session = Depends(get_db)):
-    _ensure_projects_user_id_column(db)
     user_id = _get_user_id(request)
 
-    project = Project(
-        user_id=user_id,
-        name=data.name,
-        description=data.description,
-        tech_stack=data.tech_stack,
-        infrastructure=data.infrastructure,
-        members_count=data.members_count,
-        start_date=data.start_date,
-    )
-    db.add(project)
-    db.flush()
+    # INSERT ... RETURNING: id + default-urile vin direct, fără flush + refresh
+    project = db.execute(
+        insert(Project)
+        .values(user_id=user_id, **data.model_dump())
+        .returning(Project)
+    ).scalar_one()
 
     _notify(
         db,
@@ -172,80 +309,116 @@ def create_project(data: ProjectCreate, request: Request, db: Session = Depends(
         project_id=project.id,
     )
 
+    # serializăm înainte de commit (commit-ul expiră obiectul -> ar reface SELECT-ul)
+    out = ProjectRead.model_validate(project)
     db.commit()
-    db.refresh(project)
-    return project
+    _invalidate_project_list(user_id)
+    return out
 
 
 @router.get("/", response_model=list[ProjectRead])
-def get_all_projects(request: Request, db: Session = Depends(get_db)):
-    _ensure_projects_user_id_column(db)
+def get_all_projects(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     user_id = _get_user_id(request)
 
-    return (
-        db.query(Project)
-        .filter(Project.user_id == user_id)
-        .order_by(Project.created_at.desc())
-        .all()
+    if limit is not None or cursor is not None:
+        return _get_projects_page(request, db, user_id, limit, cursor)
+
+    hit = _PROJECT_LIST_CACHE.get(user_id)
+    if hit is not None and hit[0] > time.monotonic():
+        return _etag_json_response(request, hit[1])
+
+    generation = _project_list_generation(user_id)  # înainte de citire
+    # doar coloanele din ProjectRead, ca rânduri simple (fără obiecte ORM / identity map)
+    rows = db.execute(_SEL_PROJECT_LIST, {"uid": user_id}).all()
+    body = _PROJECT_LIST_ADAPTER.dump_json(_PROJECT_LIST_ADAPTER.validate_python(rows, from_attributes=True))
+    if _PROJECTS_CACHE_TTL > 0:
+        _store_project_list(user_id, generation, body)
+    return _etag_json_response(request, body)
+
+
+def _get_projects_page(
+    request: Request, db: Session, user_id: int, limit: Optional[int], cursor: Optional[str]
+) -> Response:
+    # paginat (keyset pe created_at, id); paginile nu trec prin cache-ul listei complete
+    stmt = (
+        select(*_PROJECT_READ_COLUMNS)
+        .where(Project.user_id == user_id)
+        .order_by(*keyset_order_by(Project.created_at, Project.id, descending=True))
     )
+    if cursor is not None:
+        stmt = stmt.where(keyset_filter(Project.created_at, Project.id, cursor, descending=True))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    rows = db.execute(stmt).all()
+    body = _PROJECT_LIST_ADAPTER.dump_json(_PROJECT_LIST_ADAPTER.validate_python(rows, from_attributes=True))
+    return _etag_json_response(request, body, next_cursor_headers(rows, limit))
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
 def get_project(project_id: int, request: Request, db: Session = Depends(get_db)):
-    _ensure_projects_user_id_column(db)
     user_id = _get_user_id(request)
-    return _get_owned_project(db, project_id, user_id)
+
+    # ca la listă: doar coloanele din ProjectRead, ownership direct în WHERE
+    row = db.execute(_SEL_PROJECT_READ, {"pid": project_id, "uid": user_id}).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    body = ProjectRead.model_validate(row).model_dump_json().encode("utf-8")
+    return _etag_json_response(request, body)
 
 
 @router.patch("/{project_id}", response_model=ProjectRead)
 def update_project(project_id: int, data: ProjectUpdate, request: Request, db: Session = Depends(get_db)):
-    _ensure_projects_user_id_column(db)
     user_id = _get_user_id(request)
-    project = _get_owned_project(db, project_id, user_id)
-
-    old_name = project.name
-    changed_fields: List[str] = []
-
-    if data.name is not None and data.name != project.name:
-        project.name = data.name
-        changed_fields.append("name")
-    if data.description is not None:
-        project.description = data.description
-        changed_fields.append("description")
-    if data.tech_stack is not None:
-        project.tech_stack = data.tech_stack
-        changed_fields.append("tech_stack")
-    if data.infrastructure is not None:
-        project.infrastructure = data.infrastructure
-        changed_fields.append("infrastructure")
-    if data.members_count is not None:
-        project.members_count = data.members_count
-        changed_fields.append("members_count")
-    if data.start_date is not None:
-        project.start_date = data.start_date
-        changed_fields.append("start_date")
-
-    if changed_fields:
-        display_name = project.name or old_name
+
+    # câmpurile trimise și non-null (null = "nu modifica"); name doar dacă diferă
+    changes = {k: v for k, v in data.model_dump(exclude_unset=True).items() if v is not None}
+    owned = (Project.id == project_id, Project.user_id == user_id)
+
+    if changes and "name" not in changes:
+        # fără SELECT înainte: ownership-ul e în WHERE, 0 rânduri întoarse -> 404
+        project = db.execute(
+            update(Project).where(*owned).values(**changes).returning(Project)
+        ).scalar_one_or_none()
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+    else:
+        # patch gol sau cu name: avem nevoie de rândul curent (răspuns / comparația pe name)
+        project = _get_owned_project(db, project_id, user_id, for_update=bool(changes))
+        if changes.get("name") == project.name:
+            changes.pop("name")
+        if changes:
+            # un singur UPDATE ... RETURNING; obiectul din sesiune e actualizat din rândul întors
+            project = db.execute(
+                update(Project).where(*owned).values(**changes).returning(Project)
+            ).scalar_one()
+
+    if changes:
         _notify(
             db,
             user_id=user_id,
             ntype="project_updated",
             title="Project updated",
-            message=f"Project updated ({', '.join(changed_fields)}): {display_name}",
+            message=f"Project updated ({', '.join(changes)}): {project.name}",
             project_id=project_id,
         )
 
+    out = ProjectRead.model_validate(project)
     db.commit()
-    db.refresh(project)
-    return project
+    _invalidate_project_list(user_id)
+    return out
 
 
 @router.delete("/{project_id}", status_code=204)
 def delete_project(project_id: int, request: Request, db: Session = Depends(get_db)):
-    _ensure_projects_user_id_column(db)
     user_id = _get_user_id(request)
-    project = _get_owned_project(db, project_id, user_id)
+    project = _get_owned_project(db, project_id, user_id, for_update=True)
 
     _notify(
         db,
@@ -258,6 +431,7 @@ def delete_project(project_id: int, request: Request, db: Session = Depends(get_
 
     db.delete(project)
     db.commit()
+    _invalidate_project_list(user_id)
     return
 
 
@@ -269,42 +443,96 @@ class ProjectSummaryRequest(BaseModel):
     include_done: bool = True
 
 
-class ProjectSummaryResponse(BaseModel):
+class ProjectSummaryJobResponse(BaseModel):
+    job_id: str
     project_id: int
-    summary: str
-    method: str
+    status: str  # pending | done | failed
+    summary: Optional[str] = None
+    method: Optional[str] = None
 
 
-@router.post("/{project_id}/ai/summary", response_model=ProjectSummaryResponse)
-def create_project_summary(
-    project_id: int,
-    request: Request,
-    req: Optional[ProjectSummaryRequest] = None,
-    db: Session = Depends(get_db),
-):
-    _ensure_projects_user_id_column(db)
-    _ai_enabled_or_503()
-    user_id = _get_user_id(request)
+# job_id -> {user_id, project_id, status, summary, method}
+# in-memory (per proces); varianta async e pentru clienți care fac polling
+_SUMMARY_JOBS: Dict[str, Dict[str, Any]] = {}
+_SUMMARY_JOBS_MAX = 1000
 
-    if req is None:
-        req = ProjectSummaryRequest()
+# Cache pentru summary: fingerprint(payload) -> (expires_at, summary, method).
+# Payload-ul conține deja tot ce intră în prompt (câmpurile proiectului + textul task-urilor),
+# deci orice modificare la proiect / task-uri dă alt fingerprint.
+# Implicit OPRIT (SUMMARY_CACHE_TTL=0), ca AI_CACHE_ENABLED: "Regenerate" pe un proiect neschimbat
+# trebuie să dea un text nou; se activează explicit (secunde) pentru dev/test/CI.
+_SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", "0"))
+_SUMMARY_CACHE: Dict[str, Tuple[float, str, str]] = {}
+_SUMMARY_CACHE_MAX = 500
+
+
+def _summary_fingerprint(payload: Dict[str, Any]) -> str:
+    return _body_hash(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8"))
 
-    project = _get_owned_project(db, project_id, user_id)
 
-    q = db.query(Task).filter(Task.project_id == project_id)
+def _cached_summary(key: str) -> Optional[Tuple[str, str]]:
+    hit = _SUMMARY_CACHE.get(key)
+    if hit is None:
+        return None
+    if hit[0] <= time.monotonic():
+        _SUMMARY_CACHE.pop(key, None)
+        return None
+    return hit[1], hit[2]
+
+
+def _store_summary(key: str, summary: str, method: str) -> None:
+    if _SUMMARY_CACHE_TTL <= 0:
+        return
+    if len(_SUMMARY_CACHE) >= _SUMMARY_CACHE_MAX and key not in _SUMMARY_CACHE:
+        _SUMMARY_CACHE.pop(next(iter(_SUMMARY_CACHE)))
+    _SUMMARY_CACHE[key] = (time.monotonic() + _SUMMARY_CACHE_TTL, summary, method)
+
+
+def _build_project_summary_payload(
+    db: Session, project_id: int, user_id: int, req: ProjectSummaryRequest
+) -> Dict[str, Any]:
+    """
+    Un singur SELECT: proiectul (cu verificare de ownership) + task-urile lui (LEFT JOIN).
+    Filtrele pe task-uri stau în condiția de JOIN, ca proiectul să vină și fără task-uri.
+    """
+    task_filters = [Task.project_id == Project.id]
 
     if req.task_ids is not None:
         if len(req.task_ids) == 0:
             raise HTTPException(status_code=400, detail="task_ids cannot be empty when provided")
-        q = q.filter(Task.id.in_(req.task_ids))
+        task_filters.append(Task.id.in_(req.task_ids))
 
     if not req.include_done:
-        q = q.filter(Task.status != "done")
+        task_filters.append(Task.status != "done")
+
+    stmt = (
+        select(Project, Task)
+        .outerjoin(Task, and_(*task_filters))
+        # doar coloanele citite de _tasks_to_text
+        .options(
+            load_only(
+                Task.title,
+                Task.description,
+                Task.status,
+                Task.priority,
+                Task.complexity,
+                Task.estimated_story_points,
+                Task.assignee,
+                Task.tags,
+            )
+        )
+        .where(Project.id == project_id, Project.user_id == user_id)
+        .order_by(Task.created_at.asc())
+        .limit(_SUMMARY_MAX_TASKS)
+    )
+    rows = db.execute(stmt).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Project not found")
 
-    tasks = q.order_by(Task.created_at.asc()).all()
-    tasks_text = _tasks_to_text(tasks)
+    project = rows[0][0]
+    tasks_text = _tasks_to_text([t for _, t in rows if t is not None])
 
-    payload = {
+    return {
         "project_name": project.name,
         "project_description": project.description,
         "tech_stack": project.tech_stack,
@@ -312,27 +540,229 @@ def create_project_summary(
         "tasks": tasks_text if tasks_text else "- No tasks yet.",
     }
 
+
+async def _project_summary_job(job_id: str, project_id: int, user_id: int, payload: Dict[str, Any]) -> None:
+    """
+    Rulează după ce răspunsul 202 a fost trimis (BackgroundTasks), prin același
+    _run_project_summary ca endpoint-ul JSON; notificarea are sesiune proprie (în threadpool).
+    """
+    job: Optional[Dict[str, Any]] = None
+    try:
+        job = _SUMMARY_JOBS.get(job_id)
+        if job is None:
+            # nu ar trebui să se întâmple (doar job-urile terminate sunt evacuate)
+            logger.warning("ai_project_summary_job_missing", extra={"project_id": project_id, "job_id": job_id})
+            return
+        summary, method = await _run_project_summary(project_id, payload)
+        job.update(status="done", summary=summary, method=method)
+    except Exception:
+        logger.exception("ai_project_summary_job_failed", extra={"project_id": project_id, "job_id": job_id})
+        if job is not None:
+            job["status"] = "failed"
+        return
+    await run_in_threadpool(_project_summary_notification_job, project_id, user_id, payload["project_name"])
+
+
+def _placeholder_fallback(project_id: int, exc: Exception) -> AIService:
+    """Serviciul placeholder folosit când provider-ul pică (JSON, job și SSE); rezultatul nu intră în cache."""
+    logger.warning("ai_project_summary_failed_fallback_placeholder", extra={"project_id": project_id, "err": str(exc)})
+    fb = AIService()
+    fb.provider = "placeholder"
+    return fb
+
+
+async def _run_project_summary(project_id: int, payload: Dict[str, Any]) -> Tuple[str, str]:
+    """Cache -> provider -> fallback placeholder; singurul loc cu logica asta (JSON + job)."""
+    key = _summary_fingerprint(payload)
+    hit = _cached_summary(key)
+    if hit is not None:
+        return hit
+
     ai = AIService()
 
     try:
-        summary = ai.generate_project_summary(payload)
-        method = ai.provider
+        summary = await ai.generate_project_summary_async(payload)
     except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError) as exc:
-        logger.warning("ai_project_summary_failed_fallback_placeholder", extra={"project_id": project_id, "err": str(exc)})
-        fb = AIService()
-        fb.provider = "placeholder"
-        summary = fb.generate_project_summary(payload)
-        method = "placeholder"
+        summary = await _placeholder_fallback(project_id, exc).generate_project_summary_async(payload)
+        return summary, "placeholder"  # fallback-ul nu intră în cache
+
+    _store_summary(key, summary, ai.provider)
+    return summary, ai.provider
 
+
+def _save_project_summary_notification(db: Session, project_id: int, user_id: int, project_name: str) -> None:
     _notify(
         db,
         user_id=user_id,
         ntype="ai_project_summary",
         title="AI project summary",
-        message=f"AI summary generated for project: {project.name}",
+        message=f"AI summary generated for project: {project_name}",
         project_id=project_id,
     )
-
     db.commit()
 
-    return ProjectSummaryResponse(project_id=project_id, summary=summary, method=method)
\ No newline at end of file
+
+def _project_summary_notification_job(project_id: int, user_id: int, project_name: str) -> None:
+    """Rulează după trimiterea răspunsului (background task); sesiunea request-ului e deja închisă."""
+    try:
+        with SessionLocal() as db:
+            _save_project_summary_notification(db, project_id, user_id, project_name)
+    except Exception:
+        logger.exception("ai_project_summary_notification_failed", extra={"project_id": project_id})
+
+
+@router.post("/{project_id}/ai/summary", response_model=ProjectSummaryResponse)
+async def create_project_summary(
+    project_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    req: Optional[ProjectSummaryRequest] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    async: apelul AI nu mai ține un thread din threadpool cât așteaptă după OpenAI.
+    Lucrul cu sesiunea (sync) rulează în threadpool.
+    """
+    _ai_enabled_or_503()
+    user_id = _get_user_id(request)
+
+    if req is None:
+        req = ProjectSummaryRequest()
+
+    payload = await run_in_threadpool(_build_project_summary_payload, db, project_id, user_id, req)
+
+    summary, method = await _run_project_summary(project_id, payload)
+
+    # notificarea nu e necesară pentru răspuns -> se scrie după ce răspunsul a plecat
+    background_tasks.add_task(_project_summary_notification_job, project_id, user_id, payload["project_name"])
+
+    return ProjectSummaryResponse(project_id=project_id, summary=summary, method=method)
+
+
+def _project_summary_stream_done(project_id: int, user_id: int, project_name: str, state: Dict[str, Any]) -> None:
+    """
+    Rulează după ultimul chunk (background-ul StreamingResponse).
+    Notificarea se scrie doar dacă stream-ul a ajuns la final.
+    """
+    if state.get("done"):
+        _project_summary_notification_job(project_id, user_id, project_name)
+
+
+@router.post("/{project_id}/ai/summary/stream")
+async def stream_project_summary(
+    project_id: int,
+    request: Request,
+    req: Optional[ProjectSummaryRequest] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Același summary ca POST .../ai/summary, trimis ca Server-Sent Events pe măsură ce vine de la model:
+    `data: {"chunk": ...}` pentru fiecare bucată, apoi `event: done` cu metoda folosită.
+    """
+    _ai_enabled_or_503()
+    user_id = _get_user_id(request)
+
+    if req is None:
+        req = ProjectSummaryRequest()
+
+    payload = await run_in_threadpool(_build_project_summary_payload, db, project_id, user_id, req)
+    state: Dict[str, Any] = {"done": False}
+
+    async def events():
+        key = _summary_fingerprint(payload)
+        hit = _cached_summary(key)
+        if hit is not None:
+            state["done"] = True
+            yield sse_event({"chunk": hit[0]})
+            yield sse_event({"project_id": project_id, "method": hit[1]}, event="done")
+            return
+
+        ai = AIService()
+        method = ai.provider
+        sent = False
+        parts: List[str] = []
+        try:
+            async for chunk in ai.stream_project_summary(payload):
+                sent = True
+                parts.append(chunk)
+                yield sse_event({"chunk": chunk})
+            _store_summary(key, "".join(parts), method)
+        except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError) as exc:
+            if sent:
+                # clientul are deja o parte din text; nu amestecăm cu placeholder-ul
+                logger.warning("ai_project_summary_stream_failed", extra={"project_id": project_id, "err": str(exc)})
+                yield sse_event({"detail": "AI provider failure"}, event="error")
+                return
+            fb = _placeholder_fallback(project_id, exc)
+            method = "placeholder"
+            async for chunk in fb.stream_project_summary(payload):
+                yield sse_event({"chunk": chunk})
+
+        state["done"] = True
+        yield sse_event({"project_id": project_id, "method": method}, event="done")
+
+    return StreamingResponse(
+        events(),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+        background=BackgroundTask(
+            _project_summary_stream_done, project_id, user_id, payload["project_name"], state
+        ),
+    )
+
+
+@router.post("/{project_id}/ai/summary/jobs", response_model=ProjectSummaryJobResponse, status_code=202)
+def create_project_summary_job(
+    project_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    req: Optional[ProjectSummaryRequest] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Varianta non-blocantă: răspunde imediat cu 202 + job_id,
+    apelul AI rulează în background; rezultatul se citește cu GET .../jobs/{job_id}.
+    """
+    _ai_enabled_or_503()
+    user_id = _get_user_id(request)
+
+    if req is None:
+        req = ProjectSummaryRequest()
+
+    payload = _build_project_summary_payload(db, project_id, user_id, req)
+
+    if len(_SUMMARY_JOBS) >= _SUMMARY_JOBS_MAX:
+        # se evacuează doar job-uri terminate; cele pending încă au un background task care le scrie
+        finished = next((jid for jid, j in _SUMMARY_JOBS.items() if j["status"] in ("done", "failed")), None)
+        if finished is None:
+            raise HTTPException(status_code=503, detail="Too many summary jobs in progress, retry later")
+        _SUMMARY_JOBS.pop(finished)
+
+    job_id = uuid.uuid4().hex
+    _SUMMARY_JOBS[job_id] = {
+        "user_id": user_id,
+        "project_id": project_id,
+        "status": "pending",
+        "summary": None,
+        "method": None,
+    }
+    background_tasks.add_task(_project_summary_job, job_id, project_id, user_id, payload)
+
+    return ProjectSummaryJobResponse(job_id=job_id, project_id=project_id, status="pending")
+
+
+@router.get("/{project_id}/ai/summary/jobs/{job_id}", response_model=ProjectSummaryJobResponse)
+def get_project_summary_job(project_id: int, job_id: str, request: Request):
+    user_id = _get_user_id(request)
+
+    job = _SUMMARY_JOBS.get(job_id)
+    if not job or job["user_id"] != user_id or job["project_id"] != project_id:
+        raise HTTPException(status_code=404, detail="Summary job not found")
+
+    return ProjectSummaryJobResponse(
+        job_id=job_id,
+        project_id=project_id,
+        status=job["status"],
+        summary=job["summary"],
+        method=job["method"],
+    )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field, ConfigDict, field_validator, model_valida
 # Helpers
 # ----------------------------
 _ALLOWED_LEVELS = {"low", "medium", "high"}
+Level = Literal["low", "medium", "high"]
 _ALLOWED_STATUS = {"todo", "in_progress", "done"}
 
 
@@ -40,8 +41,8 @@ class TaskCreate(BaseModel):
 
     project_id: int
 
-    priority: str = Field(default="medium", pattern="^(low|medium|high)$")
-    complexity: str = Field(default="medium", pattern="^(low|medium|high)$")
+    priority: Level = "medium"
+    complexity: Level = "medium"
 
     assignee: Optional[str] = None
     tags: Optional[str] = None
@@ -55,11 +56,6 @@ class TaskCreate(BaseModel):
             raise ValueError("Title cannot be empty")
         return s
 
-    @field_validator("priority", "complexity")
-    @classmethod
-    def validate_levels(cls, v: str) -> str:
-        return _norm_level(v)
-
 
 # ====== UPDATE ======
 class TaskUpdate(BaseModel):
@@ -168,12 +164,8 @@ class EffortEstimateRequest(BaseModel):
 # AI: PROJECT SUMMARY
 # ============================
 
-class ProjectSummaryRequest(BaseModel):
-    project_id: int
-    include_done: bool = True
-    max_tasks: int = Field(default=50, ge=0, le=200)
-
-
+# (request-urile diferă pe router: /tasks/ai/project-summary primește project_id în body,
+#  /projects/{id}/ai/summary în path; răspunsul e același)
 class ProjectSummaryResponse(BaseModel):
     project_id: int
     summary: str
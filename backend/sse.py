@@ -0,0 +1,20 @@
+# backend/sse.py
+"""
+Server-Sent Events pentru endpoint-urile AI cu streaming (summary proiect, descriere task).
+
+Fiecare bucată de text e un eveniment `data: {...}`; finalul e `event: done`,
+iar o eroare după ce s-a trimis deja text e `event: error`.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+
+SSE_MEDIA_TYPE = "text/event-stream"
+# fără cache și fără buffering în proxy (nginx), altfel clientul primește totul la final
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
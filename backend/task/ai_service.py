@@ -2,28 +2,434 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import contextlib
+import functools
+import hashlib
 import json
 import logging
+import math
+import operator
 import os
 import re
+import threading
 import time
-from typing import Any, Dict, Optional
+import types
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+try:
+    import orjson  # optional: faster JSON for prompts / model output
+except Exception:
+    orjson = None  # type: ignore
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON (non-ASCII kept as-is), via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 # ------------------------------------------------------------
 # OpenAI SDK compatibility
 # - Supports BOTH:
 #   1) old SDK:  openai.ChatCompletion.create(...)
 #   2) new SDK:  from openai import OpenAI; client.chat.completions.create(...)
+# - import-ul SDK-ului e lazy (prima folosire a provider-ului openai), nu la import-ul modulului
+# - clienții sunt creați o singură dată per cheie și refolosiți (pool-ul HTTP e comun)
 # ------------------------------------------------------------
-try:
-    from openai import OpenAI  # new SDK (openai>=1.x)
-except Exception:
-    OpenAI = None  # type: ignore
+@functools.lru_cache(maxsize=1)
+def _openai_sdk() -> Tuple[Any, Any, Any]:
+    """(OpenAI, AsyncOpenAI, openai module); None pentru ce nu e instalat."""
+    try:
+        from openai import OpenAI  # new SDK (openai>=1.x)
+    except Exception:
+        OpenAI = None  # type: ignore
+
+    try:
+        from openai import AsyncOpenAI  # new SDK async client (httpx.AsyncClient under the hood)
+    except Exception:
+        AsyncOpenAI = None  # type: ignore
+
+    try:
+        import openai  # old SDK (openai<1.x)
+    except Exception:
+        openai = None  # type: ignore
+
+    return OpenAI, AsyncOpenAI, openai
+
+
+@functools.lru_cache(maxsize=4)
+def _openai_clients(api_key: str) -> Tuple[Any, Any]:
+    """
+    (sync client, async client) for the new SDK, None where unavailable.
+    Each has its own httpx pool with keep-alive, shared by all requests (no TCP/TLS handshake per call).
+    """
+    OpenAI, AsyncOpenAI, _ = _openai_sdk()
+    if not (OpenAI or AsyncOpenAI):
+        return None, None
+
+    import httpx  # dependency of openai>=1.x
+
+    # DefaultHttpxClient / DefaultAsyncHttpxClient păstrează default-urile SDK-ului (timeout,
+    # redirect-uri, proxy din env); se schimbă doar limitele pool-ului.
+    # SDK 1.x mai vechi (fără ele): clientul HTTP implicit al SDK-ului, fără limite custom.
+    try:
+        from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+    except Exception:
+        DefaultHttpxClient = DefaultAsyncHttpxClient = None  # type: ignore
+
+    limits = httpx.Limits(
+        max_connections=_OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=_OPENAI_MAX_KEEPALIVE,
+    )
+
+    client = None
+    if OpenAI:
+        try:
+            http_client = DefaultHttpxClient(limits=limits) if DefaultHttpxClient else None
+            client = OpenAI(api_key=api_key, max_retries=_OPENAI_MAX_RETRIES, http_client=http_client)
+        except Exception:
+            client = None
+
+    async_client = None
+    if AsyncOpenAI:
+        try:
+            http_client = DefaultAsyncHttpxClient(limits=limits) if DefaultAsyncHttpxClient else None
+            async_client = AsyncOpenAI(api_key=api_key, max_retries=_OPENAI_MAX_RETRIES, http_client=http_client)
+        except Exception:
+            async_client = None
+
+    return client, async_client
 
+
+_LOGGER = logging.getLogger("backend.ai")
+
+_AI_PROVIDER = (os.getenv("AI_PROVIDER", "placeholder") or "placeholder").strip().lower()
+_OPENAI_KEY = os.getenv("OPENAI_API_KEY")
+_OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+_EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+_OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "50"))
+_OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "20"))
+# retry-uri SDK (429 / 5xx / conexiune), cu backoff exponențial + Retry-After
+_OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+
+
+# ------------------------------------------------------------
+# Response cache (exact match)
+# - key = sha256(model, system prompt, user prompt, max_tokens, temperature)
+# - la nivel de modul: AIService() se creează per request, cache-ul trebuie să fie comun
+# - implicit OPRIT: "Regenerate" din UI trimite exact același prompt și trebuie să primească
+#   un text nou; AI_CACHE_ENABLED=true doar pentru dev/test/CI (prompturi duplicate)
+# - AI_CACHE_TTL / AI_CACHE_MAXSIZE pentru limite
+# ------------------------------------------------------------
+class _ResponseCache:
+    """LRU + TTL, thread-safe (apelurile sync rulează din threadpool)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= time.monotonic():
+                if item is not None:
+                    del self._data[key]
+                self.stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats["hits"] += 1
+            return item[1]
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_RESPONSE_CACHE: Optional[_ResponseCache] = None
+if (os.getenv("AI_CACHE_ENABLED", "false") or "").strip().lower() == "true":
+    _RESPONSE_CACHE = _ResponseCache(
+        maxsize=int(os.getenv("AI_CACHE_MAXSIZE", "1024")),
+        ttl=float(os.getenv("AI_CACHE_TTL", "3600")),
+    )
+
+
+# ------------------------------------------------------------
+# Semantic cache (near-duplicate prompts, opt-in)
+# - embedding al user prompt-ului, normalizat: OpenAI (OPENAI_EMBEDDING_MODEL) sau model local
+# - hit dacă cosine >= AI_SEMANTIC_THRESHOLD față de un prompt din același "scope"
+#   (model + system prompt + max_tokens), deci doar între cereri de același tip
+# - folosit doar pentru descrieri (titluri formulate diferit pentru același task)
+# - fără numpy/FAISS: scan liniar peste max AI_SEMANTIC_MAXSIZE vectori per scope
+# ------------------------------------------------------------
+class _SemanticCache:
+    def __init__(self, maxsize: int, ttl: float, threshold: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.stats = {"hits": 0, "misses": 0}
+        self._data: Dict[str, "OrderedDict[int, Tuple[float, List[float], str]]"] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, vector: List[float]) -> Optional[str]:
+        now = time.monotonic()
+        best_score, best_text = self.threshold, None
+        with self._lock:
+            entries = self._data.get(scope) or {}
+            for key in [k for k, item in entries.items() if item[0] <= now]:
+                del entries[key]
+            for expires_at, other, text in entries.values():
+                score = sum(map(operator.mul, vector, other))  # vectorii sunt normalizați
+                if score >= best_score:
+                    best_score, best_text = score, text
+            self.stats["hits" if best_text is not None else "misses"] += 1
+        return best_text
+
+    def set(self, scope: str, vector: List[float], value: str) -> None:
+        with self._lock:
+            entries = self._data.setdefault(scope, OrderedDict())
+            self._seq += 1
+            entries[self._seq] = (time.monotonic() + self.ttl, vector, value)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+
+# AI_SEMANTIC_EMBEDDER=openai (OPENAI_EMBEDDING_MODEL) | local (sentence-transformers, CPU, opțional)
+_SEMANTIC_EMBEDDER = (os.getenv("AI_SEMANTIC_EMBEDDER", "openai") or "openai").strip().lower()
+_SEMANTIC_LOCAL_MODEL = os.getenv("AI_SEMANTIC_LOCAL_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+
+
+@functools.lru_cache(maxsize=1)
+def _local_encoder() -> Any:
+    """Modelul local de embeddings, încărcat la prima folosire; None dacă nu e disponibil."""
+    try:
+        from sentence_transformers import SentenceTransformer  # optional dependency
+    except Exception:
+        _LOGGER.warning("sentence-transformers not installed, semantic cache disabled")
+        return None
+    try:
+        return SentenceTransformer(_SEMANTIC_LOCAL_MODEL, device="cpu")
+    except Exception:
+        _LOGGER.warning("Could not load %s, semantic cache disabled", _SEMANTIC_LOCAL_MODEL, exc_info=True)
+        return None
+
+
+_SEMANTIC_CACHE: Optional[_SemanticCache] = None
+if (os.getenv("AI_SEMANTIC_CACHE", "false") or "").strip().lower() == "true":
+    _SEMANTIC_CACHE = _SemanticCache(
+        maxsize=int(os.getenv("AI_SEMANTIC_MAXSIZE", "256")),
+        ttl=float(os.getenv("AI_CACHE_TTL", "3600")),
+        threshold=float(os.getenv("AI_SEMANTIC_THRESHOLD", "0.92")),
+    )
+
+# ------------------------------------------------------------
+# Rate limiting pentru apelurile OpenAI async
+# - OPENAI_CONCURRENCY: câte request-uri simultan (semafor)
+# - OPENAI_RPM: token bucket, max OPENAI_RPM request-uri / minut (burst până la OPENAI_RPM)
+# - 429 rămase: retry cu backoff exponențial în SDK (OPENAI_MAX_RETRIES)
+# ------------------------------------------------------------
+class _AsyncRateLimiter:
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+
+_OPENAI_SEMAPHORE = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "20")))
+_OPENAI_RATE_LIMITER = _AsyncRateLimiter(int(os.getenv("OPENAI_RPM", "500")))
+
+
+@contextlib.asynccontextmanager
+async def _openai_slot() -> AsyncIterator[None]:
+    async with _OPENAI_SEMAPHORE:
+        await _OPENAI_RATE_LIMITER.acquire()
+        yield
+
+
+# apeluri OpenAI async în curs, după cheia de cache (același event loop pentru toate request-urile)
+_INFLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
+
+def _inflight_done(key: str, fut: "asyncio.Future[str]") -> None:
+    _INFLIGHT.pop(key, None)
+    # excepția e citită aici: dacă toți cei care așteptau s-au deconectat (shield anulat),
+    # altfel asyncio loghează "Future exception was never retrieved" la fiecare eroare de provider
+    if not fut.cancelled():
+        fut.exception()
+
+_TEMPERATURE = 0.2
+
+@functools.lru_cache(maxsize=256)
+def _kv_label(key: str) -> str:
+    """'project_name' -> 'Project Name: ' (payload keys are a small fixed set, computed once each)."""
+    return f"{key.replace('_', ' ').title()}: "
+
+
+class _EstimateOut(BaseModel):
+    """Răspunsul JSON al modelului pentru o estimare (lax: "5" -> 5, chei în plus ignorate)."""
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    story_points: Optional[int] = None
+    confidence: Optional[float] = None
+    rationale: Optional[str] = None
+
+
+_ESTIMATE_ADAPTER = TypeAdapter(_EstimateOut)
+
+_FIBONACCI = (1, 2, 3, 5, 8, 13, 21)
+
+
+def _snap_story_points(sp: int) -> int:
+    """Cea mai apropiată valoare Fibonacci (la egalitate, cea mai mică)."""
+    i = bisect.bisect_left(_FIBONACCI, sp)
+    if i == 0:
+        return _FIBONACCI[0]
+    if i == len(_FIBONACCI):
+        return _FIBONACCI[-1]
+    lo, hi = _FIBONACCI[i - 1], _FIBONACCI[i]
+    return lo if sp - lo <= hi - sp else hi
+
+
+# placeholder description: (cheie payload, etichetă)
+_PLACEHOLDER_DESCRIPTION_FIELDS = (
+    ("title", "Detailed task"),
+    ("description", "Summary"),
+    ("project_name", "Project context"),
+    ("tech_stack", "Tech stack"),
+)
+_PLACEHOLDER_DESCRIPTION_EXTRAS = (
+    ("priority", "Priority"),
+    ("complexity", "Complexity"),
+    ("assignee", "Assignee"),
+    ("tags", "Tags"),
+    ("infrastructure", "Infrastructure"),
+)
+
+# latență artificială pentru placeholder (dev), în secunde; 0 = fără
+_SIMULATED_LATENCY = float(os.getenv("AI_SIMULATE_LATENCY", "0") or 0)
+
+# placeholder estimate: cuvinte care cresc complexitatea
+_COMPLEXITY_KEYWORDS = frozenset({
+    "auth", "login", "jwt", "database", "migration", "alembic",
+    "api", "integration", "deployment", "docker",
+})
+
+# un singur pass peste text, potrivire ca substring ("authentication" -> "auth", "rapid" -> "api"),
+# la fel ca verificarea inițială `kw in text`; și suprapunerile contează ("dockerapi" -> docker + api).
+# Automat Aho-Corasick dacă pyahocorasick e instalat, altfel o alternare regex precompilată
 try:
-    import openai  # old SDK (openai<1.x)
+    import ahocorasick  # optional
 except Exception:
-    openai = None  # type: ignore
+    ahocorasick = None  # type: ignore
+
+if ahocorasick is not None:
+    _COMPLEXITY_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _COMPLEXITY_KEYWORDS:
+        _COMPLEXITY_AUTOMATON.add_word(_kw, _kw)
+    _COMPLEXITY_AUTOMATON.make_automaton()
+    del _kw
+
+    def _complexity_hits(text: str) -> set[str]:
+        return {kw for _, kw in _COMPLEXITY_AUTOMATON.iter(text)}
+else:
+    # lookahead: încearcă fiecare poziție (inclusiv în interiorul unui cuvânt deja potrivit), deci
+    # găsește și potrivirile suprapuse; exact cât timp niciun keyword nu e prefixul altuia
+    _COMPLEXITY_RE = re.compile(
+        "(?=(" + "|".join(map(re.escape, sorted(_COMPLEXITY_KEYWORDS, key=len, reverse=True))) + "))"
+    )
+
+    def _complexity_hits(text: str) -> set[str]:
+        return set(_COMPLEXITY_RE.findall(text))
+
+# fallback în _json_from_text: primul {...} din răspuns (text în jurul JSON-ului)
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# câte task-uri intră într-un singur request de estimare batch (prompt + răspuns rămân mici)
+_ESTIMATE_BATCH_SIZE = int(os.getenv("AI_ESTIMATE_BATCH_SIZE", "20"))
+
+
+# ------------------------------------------------------------
+# System prompts
+# - constante (nimic interpolat), trimise primele în messages: prefixul identic între
+#   request-uri poate fi refolosit de prompt caching-ul OpenAI
+# - câmpurile variabile merg doar în user prompt, iar cele per task la final
+# ------------------------------------------------------------
+_SYSTEM_DESCRIPTION = (
+    "You write helpful software task descriptions.\n"
+    "Create a clear, structured task description that includes:\n"
+    "1) Short summary\n"
+    "2) Acceptance criteria (bullet list)\n"
+    "3) Implementation notes (bullet list)\n"
+    "Keep it concise but actionable."
+)
+
+_SYSTEM_ESTIMATE = (
+    "You are an expert agile estimator.\n"
+    "Estimate effort in Story Points using Fibonacci scale: 1,2,3,5,8,13,21.\n"
+    "Return ONLY valid JSON with keys:\n"
+    '  "story_points" (int), "confidence" (0..1), "rationale" (string)\n'
+    "Rationale must be short (max 3 sentences)."
+)
+
+_SYSTEM_ESTIMATE_BATCH = (
+    "You are an expert agile estimator.\n"
+    "Estimate effort in Story Points using Fibonacci scale: 1,2,3,5,8,13,21.\n"
+    "You get a JSON array of tasks. Return ONLY a valid JSON array with one object per task,\n"
+    "in the same order, each with keys:\n"
+    '  "story_points" (int), "confidence" (0..1), "rationale" (string)\n'
+    "Rationale must be short (max 3 sentences)."
+)
+
+_SYSTEM_PROJECT_SUMMARY = (
+    "You are an assistant that summarizes software projects for a project dashboard.\n"
+    "Write:\n"
+    "- 2-4 sentence project overview\n"
+    "- Key modules / components (bullets)\n"
+    "- Current status / risks (bullets)\n"
+    "- Next recommended steps (bullets)\n"
+    "Use the provided project data and tasks."
+)
+
+# chei per task: puse după contextul comun al proiectului (prefix mai lung, comun)
+_TASK_SPECIFIC_KEYS = ("title", "description")
+
+
+def _context_first(payload: Dict[str, Any]) -> Dict[str, Any]:
+    ordered = {k: v for k, v in payload.items() if k not in _TASK_SPECIFIC_KEYS}
+    ordered.update((k, payload[k]) for k in _TASK_SPECIFIC_KEYS if k in payload)
+    return ordered
 
 
 class AIServiceError(Exception):
@@ -51,21 +457,38 @@ class AIService:
 
     def __init__(self, timeout: int = 15):
         self.timeout = timeout
-        self.provider = (os.getenv("AI_PROVIDER", "placeholder") or "placeholder").strip().lower()
 
         # IMPORTANT: never hardcode keys in code
-        self.openai_key = os.getenv("OPENAI_API_KEY")
-        self.openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.openai_key = _OPENAI_KEY
+        self.openai_model = _OPENAI_MODEL
+        self.embedding_model = _EMBEDDING_MODEL
 
-        self.logger = logging.getLogger("backend.ai")
+        self.logger = _LOGGER
 
-        # new SDK client (if available)
+        # new SDK clients (sync + async, used by the *_async methods), shared between instances;
+        # placeholder provider -> SDK-ul nu se importă deloc
         self._client = None
-        if OpenAI and self.openai_key:
-            try:
-                self._client = OpenAI(api_key=self.openai_key)
-            except Exception:
-                self._client = None
+        self._async_client = None
+        if _AI_PROVIDER == "openai" and self.openai_key:
+            self._client, self._async_client = _openai_clients(self.openai_key)
+
+        # env citit o singură dată la import (main.py încarcă .env înainte)
+        self.provider = _AI_PROVIDER
+
+    @property
+    def provider(self) -> str:
+        return self._provider
+
+    @provider.setter
+    def provider(self, value: str) -> None:
+        # routerele pot comuta pe "placeholder" pentru fallback -> _use_openai se recalculează aici,
+        # nu la fiecare apel
+        self._provider = value
+        self._use_openai = (
+            value == "openai"
+            and bool(self.openai_key)
+            and bool(self._client or _openai_sdk()[2])
+        )
 
     # ============================================================
     # Public API
@@ -76,7 +499,7 @@ class AIService:
         self._log_start("ai_description_started", payload)
         start = time.time()
 
-        if self._should_use_openai():
+        if self._use_openai:
             try:
                 text = self._generate_openai(payload)
                 self._log_success(start, "openai", "ai_description_succeeded")
@@ -98,7 +521,7 @@ class AIService:
         self._log_start("ai_estimate_started", payload)
         start = time.time()
 
-        if self._should_use_openai():
+        if self._use_openai:
             try:
                 out = self._estimate_openai(payload)
                 self._log_success(start, "openai", "ai_estimate_succeeded")
@@ -122,7 +545,7 @@ class AIService:
         self._log_start("ai_project_summary_started", payload)
         start = time.time()
 
-        if self._should_use_openai():
+        if self._use_openai:
             try:
                 text = self._project_summary_openai(payload)
                 self._log_success(start, "openai", "ai_project_summary_succeeded")
@@ -136,18 +559,164 @@ class AIService:
         self._log_success(start, "placeholder", "ai_project_summary_succeeded")
         return text
 
+    async def generate_description_async(self, payload: Dict[str, Any]) -> str:
+        """Async variant of generate_description (same errors, same output)."""
+        self._log_start("ai_description_started", payload)
+        start = time.time()
+
+        if self._use_openai:
+            try:
+                system_prompt, user_prompt = self._description_prompts(payload)
+                text = await self._openai_chat_async(system_prompt, user_prompt, max_tokens=700, semantic=True)
+                self._log_success(start, "openai", "ai_description_succeeded")
+                return text
+            except AIServiceError:
+                raise
+            except Exception as exc:
+                raise AIServiceError("AI provider failure") from exc
+
+        text = await asyncio.to_thread(self._generate_placeholder_description, payload)
+        self._log_success(start, "placeholder", "ai_description_succeeded")
+        return text
+
+    async def generate_descriptions_batch_async(
+        self, payloads: List[Dict[str, Any]]
+    ) -> List[Union[str, BaseException]]:
+        """
+        Descriptions for several tasks, requested concurrently (asyncio.gather), in the same order.
+        A failed item is returned in place as its exception; the others are unaffected.
+        """
+        return await asyncio.gather(
+            *(self.generate_description_async(payload) for payload in payloads),
+            return_exceptions=True,
+        )
+
+    async def estimate_effort_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of estimate_effort (same errors, same output)."""
+        self._log_start("ai_estimate_started", payload)
+        start = time.time()
+
+        if self._use_openai:
+            try:
+                system_prompt, user_prompt = self._estimate_prompts(payload)
+                text = await self._openai_chat_async(system_prompt, user_prompt, max_tokens=250)
+                out = self._parse_estimate(text)
+                self._log_success(start, "openai", "ai_estimate_succeeded")
+                return out
+            except AIServiceError:
+                raise
+            except Exception as exc:
+                raise AIServiceError("AI provider failure") from exc
+
+        out = await asyncio.to_thread(self._estimate_placeholder, payload)
+        self._log_success(start, "placeholder", "ai_estimate_succeeded")
+        return out
+
+    async def estimate_effort_batch_async(
+        self, payloads: List[Dict[str, Any]], history: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimates for several tasks of the same project, in the same order as `payloads`.
+        `history` is the project-level history shared by the whole batch (sent once per prompt).
+        OpenAI: one request per ESTIMATE_BATCH_SIZE tasks (JSON array in, JSON array out)
+        instead of one request per task. Raises like estimate_effort_async.
+        """
+        if not payloads:
+            return []
+        self._log_start("ai_estimate_batch_started", {**payloads[0], "title": None, "tasks": payloads})
+        start = time.time()
+
+        if self._use_openai:
+            chunks = [payloads[i:i + _ESTIMATE_BATCH_SIZE] for i in range(0, len(payloads), _ESTIMATE_BATCH_SIZE)]
+
+            async def _estimate_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                system_prompt, user_prompt = self._estimate_batch_prompts(chunk, history)
+                text = await self._openai_chat_async(system_prompt, user_prompt, max_tokens=200 * len(chunk))
+                return self._parse_estimate_batch(text, len(chunk))
+
+            try:
+                results = await asyncio.gather(*(_estimate_chunk(chunk) for chunk in chunks))
+            except AIServiceError:
+                raise
+            except Exception as exc:
+                raise AIServiceError("AI provider failure") from exc
+            self._log_success(start, "openai", "ai_estimate_batch_succeeded")
+            return [out for chunk_out in results for out in chunk_out]
+
+        outs = await asyncio.to_thread(lambda: [self._estimate_placeholder({**p, "history": history}) for p in payloads])
+        self._log_success(start, "placeholder", "ai_estimate_batch_succeeded")
+        return outs
+
+    async def generate_project_summary_async(self, payload: Dict[str, Any]) -> str:
+        """
+        Async variant of generate_project_summary (same errors, same output).
+        OpenAI calls don't hold a worker thread while waiting on the network.
+        """
+        self._log_start("ai_project_summary_started", payload)
+        start = time.time()
+
+        if self._use_openai:
+            try:
+                system_prompt, user_prompt = self._project_summary_prompts(payload)
+                text = await self._openai_chat_async(system_prompt, user_prompt, max_tokens=650)
+                self._log_success(start, "openai", "ai_project_summary_succeeded")
+                return text
+            except AIServiceError:
+                raise
+            except Exception as exc:
+                raise AIServiceError("AI provider failure") from exc
+
+        # placeholder may sleep (AI_SIMULATE_LATENCY) -> keep it off the event loop
+        text = await asyncio.to_thread(self._project_summary_placeholder, payload)
+        self._log_success(start, "placeholder", "ai_project_summary_succeeded")
+        return text
+
+    async def stream_description(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Same description as generate_description_async, yielded in chunks as the model produces them.
+        The placeholder (and the old SDK) yield the whole text as a single chunk.
+        """
+        self._log_start("ai_description_started", payload)
+        start = time.time()
+
+        if self._use_openai:
+            system_prompt, user_prompt = self._description_prompts(payload)
+            async for chunk in self._openai_chat_stream(system_prompt, user_prompt, max_tokens=700):
+                yield chunk
+            self._log_success(start, "openai", "ai_description_succeeded")
+            return
+
+        text = await asyncio.to_thread(self._generate_placeholder_description, payload)
+        self._log_success(start, "placeholder", "ai_description_succeeded")
+        yield text
+
+    async def stream_project_summary(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Same summary as generate_project_summary_async, yielded in chunks as the model produces them.
+        The placeholder (and the old SDK) yield the whole text as a single chunk.
+        """
+        self._log_start("ai_project_summary_started", payload)
+        start = time.time()
+
+        if self._use_openai:
+            system_prompt, user_prompt = self._project_summary_prompts(payload)
+            async for chunk in self._openai_chat_stream(system_prompt, user_prompt, max_tokens=650):
+                yield chunk
+            self._log_success(start, "openai", "ai_project_summary_succeeded")
+            return
+
+        text = await asyncio.to_thread(self._project_summary_placeholder, payload)
+        self._log_success(start, "placeholder", "ai_project_summary_succeeded")
+        yield text
+
     # ============================================================
     # Internal helpers
     # ============================================================
 
-    def _should_use_openai(self) -> bool:
-        if self.provider != "openai":
-            return False
-        if not self.openai_key:
-            return False
-        return bool(self._client or openai)
-
     def _log_start(self, event: str, payload: Dict[str, Any]) -> None:
+        # extra-ul se construiește doar dacă INFO chiar e emis
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         # payloads differ between endpoints; don't assume "title" exists
         self.logger.info(
             event,
@@ -160,8 +729,19 @@ class AIService:
         )
 
     def _log_success(self, start: float, provider: str, event: str) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         elapsed = round(time.time() - start, 3)
-        self.logger.info(event, extra={"provider": provider, "elapsed_seconds": elapsed})
+        stats = self.stats
+        self.logger.info(
+            event,
+            extra={
+                "provider": provider,
+                "elapsed_seconds": elapsed,
+                "cache_hits": stats["hits"],
+                "cache_misses": stats["misses"],
+            },
+        )
 
     def _truncate(self, s: str, max_chars: int) -> str:
         s = (s or "").strip()
@@ -173,35 +753,42 @@ class AIService:
         """
         Build a readable key-value prompt, but keep it bounded (important for tasks list).
         """
-        def _fmt(v: Any) -> str:
-            if v is None:
-                return ""
-            if isinstance(v, (list, tuple)):
-                # if tasks list is huge, keep it reasonable
-                items = list(v)[:200]
-                out_lines = []
-                for x in items:
-                    if isinstance(x, dict):
-                        out_lines.append(json.dumps(x, ensure_ascii=False))
-                    else:
-                        out_lines.append(str(x))
-                return "\n".join(f"- {line}" for line in out_lines if line.strip())
-            if isinstance(v, dict):
-                return json.dumps(v, ensure_ascii=False)
-            return str(v)
-
-        lines = []
+        def _dump(x: Any) -> str:
+            # compact JSON: fewer tokens in the prompt for the same content
+            if isinstance(x, dict):
+                return _dumps(x)
+            return str(x)
+
+        def _fmt(v: Any, budget: int) -> str:
+            if isinstance(v, (list, tuple, types.GeneratorType)):
+                # if tasks list is huge, keep it reasonable (islice: never walks past item 200)
+                out, size = [], -1
+                for line in map(_dump, islice(v, 200)):
+                    if not line.strip():
+                        continue
+                    out.append(f"- {line}")
+                    size += 3 + len(line)
+                    if size - len(line) + len(line.rstrip()) > budget:
+                        break  # already over max_chars, the rest would be truncated anyway
+                return "\n".join(out)
+            return _dump(v)
+
+        # early exit: stop formatting once the prompt is past max_chars
+        # (_truncate gives the same result as for the full text)
+        lines: List[str] = []
+        total = -1  # no "\n" before the first line
         for k, v in payload.items():
             if v is None:
                 continue
-            s = _fmt(v).strip()
+            key = _kv_label(k)
+            s = _fmt(v, max_chars - total - 1 - len(key)).strip()
             if not s:
                 continue
-            key = k.replace("_", " ").title()
-            lines.append(f"{key}: {s}")
-
-        joined = "\n".join(lines).strip()
-        return self._truncate(joined, max_chars=max_chars)
+            lines.append(key + s)
+            total += 1 + len(key) + len(s)
+            if total > max_chars:
+                break
+        return self._truncate("\n".join(lines), max_chars=max_chars)
 
     def _extract_text(self, response: Any) -> str:
         """Extract text from both SDK variants."""
@@ -223,7 +810,7 @@ class AIService:
 
         return ""
 
-    def _json_from_text(self, text: str) -> Dict[str, Any]:
+    def _json_from_text(self, text: str) -> Any:
         """
         Tries to parse JSON even if model wraps it in ```json ...```.
         """
@@ -231,18 +818,23 @@ class AIService:
         if not s:
             raise AIServiceInvalidResponseError("Empty AI response")
 
-        # remove ```json fences if present
-        s = re.sub(r"^```(?:json)?\s*", "", s, flags=re.IGNORECASE)
-        s = re.sub(r"\s*```$", "", s)
+        # remove ```json fences if present (plain string ops, no regex per response)
+        if s.startswith("```"):
+            s = s[3:]
+            if s[:4].lower() == "json":
+                s = s[4:]
+            s = s.lstrip()
+        if s.endswith("```"):
+            s = s[:-3].rstrip()
 
         try:
-            return json.loads(s)
+            return _loads(s)
         except Exception:
             # try to find first {...} block
-            m = re.search(r"\{.*\}", s, flags=re.DOTALL)
+            m = _JSON_BLOCK_RE.search(s)
             if m:
                 try:
-                    return json.loads(m.group(0))
+                    return _loads(m.group(0))
                 except Exception:
                     pass
             raise AIServiceInvalidResponseError("AI returned invalid JSON")
@@ -251,7 +843,117 @@ class AIService:
     # OpenAI implementations
     # ============================================================
 
-    def _openai_chat(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+    def _cache_key(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        raw = json.dumps([self.openai_model, system_prompt, user_prompt, max_tokens, _TEMPERATURE])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit / miss pentru cache-ul de răspunsuri (comun tuturor instanțelor)."""
+        return dict(_RESPONSE_CACHE.stats) if _RESPONSE_CACHE else {"hits": 0, "misses": 0}
+
+    def _semantic_scope(self, system_prompt: str, max_tokens: int) -> str:
+        # embedder-ul e în scope: vectori din modele diferite nu se compară între ei
+        embedder = _SEMANTIC_LOCAL_MODEL if _SEMANTIC_EMBEDDER == "local" else self.embedding_model
+        raw = json.dumps([self.openai_model, system_prompt, max_tokens, _TEMPERATURE, embedder])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _normalize(self, vector: List[float]) -> Optional[List[float]]:
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else None
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embedding pentru semantic cache; best-effort (None = fără cache semantic)."""
+        if _SEMANTIC_EMBEDDER == "local":
+            encoder = _local_encoder()
+            if encoder is None:
+                return None
+            try:
+                return [float(x) for x in encoder.encode(text, normalize_embeddings=True)]
+            except Exception:
+                self.logger.warning("Local embedding failed, semantic cache skipped", exc_info=True)
+                return None
+
+        if not self._client:
+            return None
+        try:
+            resp = self._client.embeddings.create(
+                model=self.embedding_model, input=text, timeout=self.timeout
+            )
+            return self._normalize(list(resp.data[0].embedding))
+        except Exception:
+            self.logger.warning("Embedding request failed, semantic cache skipped", exc_info=True)
+            return None
+
+    async def _embed_async(self, text: str) -> Optional[List[float]]:
+        if _SEMANTIC_EMBEDDER == "local" or not self._async_client:
+            # modelul local e CPU-bound -> worker thread, nu event loop
+            return await asyncio.to_thread(self._embed, text)
+        try:
+            resp = await self._async_client.embeddings.create(
+                model=self.embedding_model, input=text, timeout=self.timeout
+            )
+            return self._normalize(list(resp.data[0].embedding))
+        except Exception:
+            self.logger.warning("Embedding request failed, semantic cache skipped", exc_info=True)
+            return None
+
+    def _openai_chat(
+        self, system_prompt: str, user_prompt: str, max_tokens: int, semantic: bool = False
+    ) -> str:
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        if _RESPONSE_CACHE is not None:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        vector = self._embed(user_prompt) if semantic and _SEMANTIC_CACHE is not None else None
+        if vector is not None:
+            cached = _SEMANTIC_CACHE.get(self._semantic_scope(system_prompt, max_tokens), vector)
+            if cached is not None:
+                return cached
+
+        text = self._openai_chat_request(system_prompt, user_prompt, max_tokens)
+        if _RESPONSE_CACHE is not None:
+            _RESPONSE_CACHE.set(key, text)
+        if vector is not None:
+            _SEMANTIC_CACHE.set(self._semantic_scope(system_prompt, max_tokens), vector, text)
+        return text
+
+    async def _openai_chat_async(
+        self, system_prompt: str, user_prompt: str, max_tokens: int, semantic: bool = False
+    ) -> str:
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        if _RESPONSE_CACHE is not None:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        vector = None
+        if semantic and _SEMANTIC_CACHE is not None:
+            vector = await self._embed_async(user_prompt)
+        if vector is not None:
+            cached = _SEMANTIC_CACHE.get(self._semantic_scope(system_prompt, max_tokens), vector)
+            if cached is not None:
+                return cached
+
+        # single-flight: cereri identice concurente așteaptă același apel OpenAI
+        inflight = _INFLIGHT.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._openai_chat_async_request(system_prompt, user_prompt, max_tokens)
+            )
+            _INFLIGHT[key] = inflight
+            inflight.add_done_callback(functools.partial(_inflight_done, key))
+        # shield: dacă un client se deconectează, apelul continuă pentru ceilalți
+        text = await asyncio.shield(inflight)
+        if _RESPONSE_CACHE is not None:
+            _RESPONSE_CACHE.set(key, text)
+        if vector is not None:
+            _SEMANTIC_CACHE.set(self._semantic_scope(system_prompt, max_tokens), vector, text)
+        return text
+
+    def _openai_chat_request(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
         # Prefer new SDK if available
         if self._client:
             try:
@@ -261,7 +963,7 @@ class AIService:
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt},
                     ],
-                    temperature=0.2,
+                    temperature=_TEMPERATURE,
                     max_tokens=max_tokens,
                     timeout=self.timeout,
                 )
@@ -277,6 +979,7 @@ class AIService:
                 raise AIServiceError("AI provider failure") from exc
 
         # Fallback to old SDK
+        openai = _openai_sdk()[2]
         if openai:
             try:
                 openai.api_key = self.openai_key
@@ -286,7 +989,7 @@ class AIService:
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_prompt},
                     ],
-                    temperature=0.2,
+                    temperature=_TEMPERATURE,
                     max_tokens=max_tokens,
                     request_timeout=self.timeout,
                 )
@@ -307,68 +1010,139 @@ class AIService:
 
         raise AIServiceError("OpenAI SDK is not installed")
 
+    async def _openai_chat_async_request(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        if not self._async_client:
+            # old SDK / no async client: run the sync call in a worker thread
+            return await asyncio.to_thread(self._openai_chat_request, system_prompt, user_prompt, max_tokens)
+
+        try:
+            async with _openai_slot():
+                resp = await self._async_client.chat.completions.create(
+                    model=self.openai_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=_TEMPERATURE,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                )
+            text = self._extract_text(resp)
+            if not text:
+                raise AIServiceInvalidResponseError("Empty response from OpenAI")
+            return text
+        except AIServiceInvalidResponseError:
+            raise
+        except Exception as exc:
+            if "timeout" in str(exc).lower():
+                raise AIServiceTimeoutError("OpenAI timeout") from exc
+            raise AIServiceError("AI provider failure") from exc
+
+    async def _openai_chat_stream(
+        self, system_prompt: str, user_prompt: str, max_tokens: int
+    ) -> AsyncIterator[str]:
+        if not self._async_client:
+            yield await asyncio.to_thread(self._openai_chat, system_prompt, user_prompt, max_tokens)
+            return
+
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        if _RESPONSE_CACHE is not None:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        try:
+            # slot-ul e ținut cât durează stream-ul (conexiunea e ocupată până la ultimul chunk)
+            async with _openai_slot():
+                stream = await self._async_client.chat.completions.create(
+                    model=self.openai_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=_TEMPERATURE,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    stream=True,
+                )
+                async for event in stream:
+                    delta = event.choices[0].delta.content if event.choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        except Exception as exc:
+            if "timeout" in str(exc).lower():
+                raise AIServiceTimeoutError("OpenAI timeout") from exc
+            raise AIServiceError("AI provider failure") from exc
+
+        if not parts:
+            raise AIServiceInvalidResponseError("Empty response from OpenAI")
+        # stream complet -> același cache ca pentru răspunsul ne-streamed
+        if _RESPONSE_CACHE is not None:
+            _RESPONSE_CACHE.set(key, "".join(parts))
+
     def _generate_openai(self, payload: Dict[str, Any]) -> str:
-        system_prompt = (
-            "You write helpful software task descriptions.\n"
-            "Create a clear, structured task description that includes:\n"
-            "1) Short summary\n"
-            "2) Acceptance criteria (bullet list)\n"
-            "3) Implementation notes (bullet list)\n"
-            "Keep it concise but actionable."
-        )
-        user_prompt = self._build_kv_prompt(payload, max_chars=12000)
-        return self._openai_chat(system_prompt, user_prompt, max_tokens=700)
+        system_prompt, user_prompt = self._description_prompts(payload)
+        return self._openai_chat(system_prompt, user_prompt, max_tokens=700, semantic=True)
+
+    def _description_prompts(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        system_prompt = _SYSTEM_DESCRIPTION
+        user_prompt = self._build_kv_prompt(_context_first(payload), max_chars=12000)
+        return system_prompt, user_prompt
 
     def _estimate_openai(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        system_prompt = (
-            "You are an expert agile estimator.\n"
-            "Estimate effort in Story Points using Fibonacci scale: 1,2,3,5,8,13,21.\n"
-            "Return ONLY valid JSON with keys:\n"
-            '  "story_points" (int), "confidence" (0..1), "rationale" (string)\n'
-            "Rationale must be short (max 3 sentences)."
-        )
-        user_prompt = self._build_kv_prompt(payload, max_chars=12000)
+        system_prompt, user_prompt = self._estimate_prompts(payload)
         text = self._openai_chat(system_prompt, user_prompt, max_tokens=250)
-        data = self._json_from_text(text)
+        return self._parse_estimate(text)
 
-        sp_raw = data.get("story_points")
-        conf_raw = data.get("confidence", 0.6)
-        rat_raw = data.get("rationale", "")
+    def _estimate_prompts(self, payload: Dict[str, Any]) -> Tuple[str, str]:
+        system_prompt = _SYSTEM_ESTIMATE
+        user_prompt = self._build_kv_prompt(_context_first(payload), max_chars=12000)
+        return system_prompt, user_prompt
 
-        try:
-            sp = int(sp_raw)
-        except Exception:
-            sp = 3
+    def _parse_estimate(self, text: str) -> Dict[str, Any]:
+        return self._normalize_estimate(self._json_from_text(text))
 
+    def _normalize_estimate(self, data: Any) -> Dict[str, Any]:
         try:
-            conf = float(conf_raw)
-        except Exception:
-            conf = 0.6
-
-        rationale = str(rat_raw or "").strip() or "Estimated based on provided context."
-
-        allowed = [1, 2, 3, 5, 8, 13, 21]
-        if sp not in allowed:
-            sp = min(allowed, key=lambda x: abs(x - sp))
+            est = _ESTIMATE_ADAPTER.validate_python(data)
+        except ValidationError as exc:
+            raise AIServiceInvalidResponseError("AI returned invalid estimate") from exc
 
-        conf = max(0.0, min(1.0, conf))
+        sp = _snap_story_points(est.story_points if est.story_points is not None else 3)
+        conf = max(0.0, min(1.0, est.confidence if est.confidence is not None else 0.6))
+        rationale = (est.rationale or "").strip() or "Estimated based on provided context."
 
         return {"story_points": sp, "confidence": conf, "rationale": rationale, "method": "openai"}
 
+    def _estimate_batch_prompts(self, payloads: List[Dict[str, Any]], history: Optional[str] = None) -> Tuple[str, str]:
+        system_prompt = _SYSTEM_ESTIMATE_BATCH
+        # contextul proiectului e comun -> o singură dată, nu per task; istoricul vine separat,
+        # la nivel de proiect (nu cel al primului task din batch)
+        context = {k: v for k, v in payloads[0].items() if k not in ("title", "description", "history")}
+        context["history"] = history
+        tasks = [{"title": p.get("title"), "description": p.get("description")} for p in payloads]
+        user_prompt = self._build_kv_prompt({**context, "tasks": _dumps(tasks)}, max_chars=24000)
+        return system_prompt, user_prompt
+
+    def _parse_estimate_batch(self, text: str, count: int) -> List[Dict[str, Any]]:
+        data = self._json_from_text(text)
+        if not isinstance(data, list) or len(data) != count:
+            raise AIServiceInvalidResponseError("AI returned an estimate list of the wrong shape")
+        return [self._normalize_estimate(item) for item in data]
+
     def _project_summary_openai(self, payload: Dict[str, Any]) -> str:
+        system_prompt, user_prompt = self._project_summary_prompts(payload)
+        return self._openai_chat(system_prompt, user_prompt, max_tokens=650)
+
+    def _project_summary_prompts(self, payload: Dict[str, Any]) -> Tuple[str, str]:
         """
         If caller passes tasks_text (string), we keep it as is.
         If caller passes tasks (list), prompt builder will format it.
         """
-        system_prompt = (
-            "You are an assistant that summarizes software projects for a project dashboard.\n"
-            "Write:\n"
-            "- 2-4 sentence project overview\n"
-            "- Key modules / components (bullets)\n"
-            "- Current status / risks (bullets)\n"
-            "- Next recommended steps (bullets)\n"
-            "Use the provided project data and tasks."
-        )
+        system_prompt = _SYSTEM_PROJECT_SUMMARY
 
         # normalize: accept tasks_text too
         normalized = dict(payload)
@@ -376,32 +1150,37 @@ class AIService:
             normalized["tasks"] = normalized.get("tasks_text")
 
         user_prompt = self._build_kv_prompt(normalized, max_chars=16000)
-        return self._openai_chat(system_prompt, user_prompt, max_tokens=650)
+        return system_prompt, user_prompt
 
     # ============================================================
     # Placeholder implementations
     # ============================================================
 
+    def _simulate_latency(self) -> None:
+        # doar pentru dev (AI_SIMULATE_LATENCY=secunde); implicit placeholder-ul răspunde imediat
+        if _SIMULATED_LATENCY > 0:
+            time.sleep(min(_SIMULATED_LATENCY, self.timeout))
+
     def _generate_placeholder_description(self, payload: Dict[str, Any]) -> str:
-        time.sleep(min(0.2, self.timeout))
+        self._simulate_latency()
 
+        # câmpurile lipsă (None) nu apar deloc, fără filtrare ulterioară pe text
         parts = [
-            f"Detailed task: {payload.get('title')}",
-            f"Summary: {payload.get('description')}",
-            f"Project context: {payload.get('project_name')}",
-            f"Tech stack: {payload.get('tech_stack')}",
+            f"{label}: {value}"
+            for key, label in _PLACEHOLDER_DESCRIPTION_FIELDS
+            if (value := payload.get(key)) is not None
+        ]
+        parts += [
+            f"{label}: {value}"
+            for key, label in _PLACEHOLDER_DESCRIPTION_EXTRAS
+            if (value := payload.get(key))
         ]
-
-        for extra_key in ["priority", "complexity", "assignee", "tags", "infrastructure"]:
-            if payload.get(extra_key):
-                parts.append(f"{extra_key.replace('_', ' ').title()}: {payload.get(extra_key)}")
-
         parts += [
             "Acceptance criteria:\n- Clear and testable conditions",
             "Implementation notes:\n- Break down into small tasks\n- Add unit tests if applicable",
         ]
 
-        content = "\n\n".join(p for p in parts if p and "None" not in str(p))
+        content = "\n\n".join(parts)
         if not content.strip():
             raise AIServiceInvalidResponseError("Placeholder returned empty text")
         return content
@@ -411,15 +1190,13 @@ class AIService:
         desc = (payload.get("description") or "").lower()
         history = payload.get("history") or ""
 
-        complexity_hits = 0
-        for kw in [
-            "auth", "login", "jwt", "database", "migration", "alembic",
-            "api", "integration", "deployment", "docker",
-        ]:
-            if kw in title or kw in desc:
-                complexity_hits += 1
+        # un singur pass peste titlu + descriere (nu 2 căutări substring per keyword)
+        complexity_hits = len(_complexity_hits(title + "\n" + desc))
 
-        hist_len = len(str(history).splitlines())
+        # numără liniile separate prin "\n" (ultima poate fi fără "\n"), fără a construi lista;
+        # spre deosebire de splitlines(), \r, \x0b, \x0c, \x1c-\x1e, \x85, \u2028/\u2029 nu încep linii noi
+        h = history if isinstance(history, str) else str(history)
+        hist_len = h.count("\n") + (1 if h and not h.endswith("\n") else 0)
 
         base = 2
         if complexity_hits == 1:
@@ -432,8 +1209,7 @@ class AIService:
         if hist_len > 80:
             base = min(13, base + 2)
 
-        allowed = [1, 2, 3, 5, 8, 13, 21]
-        sp = min(allowed, key=lambda x: abs(x - base))
+        sp = _snap_story_points(base)
 
         return {
             "story_points": sp,
@@ -443,7 +1219,7 @@ class AIService:
         }
 
     def _project_summary_placeholder(self, payload: Dict[str, Any]) -> str:
-        time.sleep(min(0.2, self.timeout))
+        self._simulate_latency()
 
         project_name = payload.get("project_name") or "Project"
         desc = payload.get("project_description") or ""
@@ -457,14 +1233,11 @@ class AIService:
 
         if isinstance(tasks, str):
             tasks_text = tasks.strip()
-        elif isinstance(tasks, list):
-            lines = []
-            for t in tasks[:50]:
-                if isinstance(t, dict):
-                    lines.append(f"- {t.get('title', 'Task')} (status={t.get('status', '-')})")
-                else:
-                    lines.append(f"- {t}")
-            tasks_text = "\n".join(lines)
+        elif isinstance(tasks, (list, tuple, types.GeneratorType)):
+            tasks_text = "\n".join([
+                f"- {t.get('title', 'Task')} (status={t.get('status', '-')})" if isinstance(t, dict) else f"- {t}"
+                for t in islice(tasks, 50)
+            ])
         else:
             tasks_text = str(tasks)
 
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel, Field
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import desc, insert, select
+from sqlalchemy.orm import Session, load_only
+from starlette.background import BackgroundTask
 
 from backend.auth.auth_router import get_db
-from backend.models.notification import Notification
+from backend.database import SessionLocal
+from backend.pagination import MAX_PAGE_SIZE, keyset_filter, keyset_order_by, next_cursor_headers
+from backend.sse import SSE_HEADERS, SSE_MEDIA_TYPE, sse_event
 from backend.models.project import Project
 from backend.models.task import Task
+from backend.notification.notification_service import queue_notification, queue_notifications
 from backend.schemas.task_schema import (
     EffortEstimateRequest,
     EffortEstimateResponse,
+    ProjectSummaryResponse,
     TaskCreate,
     TaskRead,
     TaskUpdate,
@@ -31,6 +38,9 @@ from backend.task.ai_service import (
 logger = logging.getLogger("backend.task")
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# citit o singură dată (main.py încarcă .env înainte de import-ul router-elor)
+_AI_ENABLED = os.getenv("AI_ENABLED", "false").strip().lower() == "true"
+
 
 # =========================================================
 # REQUEST MODELS
@@ -53,17 +63,11 @@ class ProjectSummaryRequest(BaseModel):
     include_done: bool = True
 
 
-class ProjectSummaryResponse(BaseModel):
-    project_id: int
-    summary: str
-    method: str
-
-
 # =========================================================
 # HELPERS
 # =========================================================
 def _ai_enabled_or_503() -> None:
-    if os.getenv("AI_ENABLED", "false").strip().lower() != "true":
+    if not _AI_ENABLED:
         raise HTTPException(
             status_code=503,
             detail="AI functionality is disabled (set AI_ENABLED=true)",
@@ -100,6 +104,26 @@ def _get_user_id(request: Request) -> int:
     return 1
 
 
+def _notification_row(
+    *,
+    user_id: int,
+    ntype: str,
+    title: str,
+    message: str,
+    project_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "type": ntype,
+        "title": title,
+        "message": message,
+        "is_read": False,
+        "project_id": project_id,
+        "task_id": task_id,
+    }
+
+
 def _notify(
     db: Session,
     *,
@@ -111,34 +135,30 @@ def _notify(
     task_id: Optional[int] = None,
 ) -> None:
     """
-    Creează o notificare. Nu face commit aici.
+    Pune o notificare în coadă. Nu face commit aici;
+    toate notificările din request se scriu cu un singur INSERT la commit.
     IMPORTANT: notifications.user_id e NOT NULL.
     """
-    try:
-        n = Notification(
+    queue_notification(
+        db,
+        **_notification_row(
             user_id=user_id,
-            type=ntype,
+            ntype=ntype,
             title=title,
             message=message,
-            is_read=False,
-            created_at=datetime.utcnow(),
             project_id=project_id,
             task_id=task_id,
-        )
-        db.add(n)
-    except Exception:
-        logger.exception(
-            "notification_create_failed",
-            extra={"type": ntype, "project_id": project_id, "task_id": task_id, "user_id": user_id},
-        )
+        ),
+    )
 
 
 def _get_owned_project(db: Session, project_id: int, user_id: int) -> Project:
     """
     Returnează proiectul doar dacă aparține user-ului.
     """
-    project = db.query(Project).filter(Project.id == project_id, Project.user_id == user_id).first()
-    if not project:
+    # db.get: fără SELECT dacă proiectul e deja în identity map-ul sesiunii
+    project = db.get(Project, project_id)
+    if not project or project.user_id != user_id:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
@@ -148,12 +168,11 @@ def _get_owned_task(db: Session, task_id: int, user_id: int) -> Task:
     Returnează task-ul doar dacă task-ul este într-un proiect al user-ului.
     (join Task -> Project)
     """
-    task = (
-        db.query(Task)
+    task = db.execute(
+        select(Task)
         .join(Project, Project.id == Task.project_id)
-        .filter(Task.id == task_id, Project.user_id == user_id)
-        .first()
-    )
+        .where(Task.id == task_id, Project.user_id == user_id)
+    ).scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
@@ -162,7 +181,7 @@ def _get_owned_task(db: Session, task_id: int, user_id: int) -> Task:
 def _build_history_text(
     db: Session,
     project_id: int,
-    current_task_id: int,
+    exclude_task_ids: Collection[int],
     max_history_tasks: int,
 ) -> Optional[str]:
     if max_history_tasks <= 0:
@@ -170,7 +189,7 @@ def _build_history_text(
 
     prev_tasks = (
         db.query(Task)
-        .filter(Task.project_id == project_id, Task.id != current_task_id)
+        .filter(Task.project_id == project_id, Task.id.notin_(exclude_task_ids))
         .order_by(desc(Task.created_at))
         .limit(max_history_tasks)
         .all()
@@ -214,6 +233,46 @@ def _task_to_summary_item(t: Task) -> Dict[str, Any]:
     }
 
 
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskRead])
+
+
+def _task_list_response(tasks: List[Task], limit: Optional[int] = None) -> Response:
+    """
+    Listă -> JSON direct cu pydantic-core (bytes), fără pasul intermediar
+    dict + json.dumps din serializarea default a FastAPI.
+    """
+    body = _TASK_LIST_ADAPTER.dump_json(_TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True))
+    return Response(content=body, media_type="application/json", headers=next_cursor_headers(tasks, limit))
+
+
+def _description_payload(task: Task, project: Optional[Project]) -> Dict[str, Any]:
+    return {
+        "title": task.title,
+        "description": task.description,
+        "project_name": project.name if project else None,
+        "project_description": project.description if project else None,
+        "tech_stack": getattr(project, "tech_stack", None) if project else None,
+        "infrastructure": getattr(project, "infrastructure", None) if project else None,
+        "priority": task.priority,
+        "complexity": task.complexity,
+        "assignee": task.assignee,
+        "tags": task.tags,
+    }
+
+
+def _estimate_payload(task: Task, project: Optional[Project], history_text: Optional[str]) -> Dict[str, Any]:
+    return {
+        "title": task.title,
+        "description": task.description,
+        "project_name": project.name if project else None,
+        "project_description": project.description if project else None,
+        "tech_stack": getattr(project, "tech_stack", None) if project else None,
+        "infrastructure": getattr(project, "infrastructure", None) if project else None,
+        "history": history_text,
+        "scale": "Fibonacci 1,2,3,5,8,13,21",
+    }
+
+
 # =========================================================
 # CRUD TASKS (scoped to user)
 # =========================================================
@@ -224,18 +283,21 @@ def create_task(data: TaskCreate, request: Request, db: Session = Depends(get_db
     # ✅ NU permite creare task într-un project care nu aparține user-ului
     _get_owned_project(db, data.project_id, user_id)
 
-    task = Task(
-        title=data.title,
-        description=data.description,
-        project_id=data.project_id,
-        priority=data.priority,
-        complexity=data.complexity,
-        assignee=data.assignee,
-        tags=data.tags,
-        source=getattr(data, "source", "manual"),
-    )
-    db.add(task)
-    db.flush()
+    # INSERT ... RETURNING: id + default-urile vin direct, fără flush + refresh
+    task = db.execute(
+        insert(Task)
+        .values(
+            title=data.title,
+            description=data.description,
+            project_id=data.project_id,
+            priority=data.priority,
+            complexity=data.complexity,
+            assignee=data.assignee,
+            tags=data.tags,
+            source=getattr(data, "source", "manual"),
+        )
+        .returning(Task)
+    ).scalar_one()
 
     _notify(
         db,
@@ -247,34 +309,60 @@ def create_task(data: TaskCreate, request: Request, db: Session = Depends(get_db
         task_id=task.id,
     )
 
+    # serializăm înainte de commit (commit-ul expiră obiectul -> ar reface SELECT-ul)
+    out = TaskRead.model_validate(task)
     db.commit()
-    db.refresh(task)
-    return task
+    return out
 
 
 @router.get("/", response_model=list[TaskRead])
-def get_all_tasks(request: Request, db: Session = Depends(get_db)):
+def get_all_tasks(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     """
     Dacă vrei să existe, îl facem și pe ăsta scoped pe user.
+    Paginare opțională: ?limit=&cursor= (vezi backend/pagination.py).
     """
     user_id = _get_user_id(request)
-    return (
+    q = (
         db.query(Task)
         .join(Project, Project.id == Task.project_id)
         .filter(Project.user_id == user_id)
-        .order_by(Task.created_at.desc())
-        .all()
+        .order_by(*keyset_order_by(Task.created_at, Task.id, descending=True))
     )
+    if cursor is not None:
+        q = q.filter(keyset_filter(Task.created_at, Task.id, cursor, descending=True))
+    if limit is not None:
+        q = q.limit(limit)
+    return _task_list_response(q.all(), limit)
 
 
 @router.get("/project/{project_id}", response_model=list[TaskRead])
-def get_tasks_by_project(project_id: int, request: Request, db: Session = Depends(get_db)):
+def get_tasks_by_project(
+    project_id: int,
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     user_id = _get_user_id(request)
 
     # ✅ verifică ownership la proiect (altfel poți vedea task-urile altuia)
     _get_owned_project(db, project_id, user_id)
 
-    return db.query(Task).filter(Task.project_id == project_id).order_by(Task.created_at.asc()).all()
+    q = (
+        db.query(Task)
+        .filter(Task.project_id == project_id)
+        .order_by(*keyset_order_by(Task.created_at, Task.id, descending=False))
+    )
+    if cursor is not None:
+        q = q.filter(keyset_filter(Task.created_at, Task.id, cursor, descending=False))
+    if limit is not None:
+        q = q.limit(limit)
+    return _task_list_response(q.all(), limit)
 
 
 @router.get("/{task_id}", response_model=TaskRead)
@@ -283,46 +371,26 @@ def get_task(task_id: int, request: Request, db: Session = Depends(get_db)):
     return _get_owned_task(db, task_id, user_id)
 
 
+# PATCH /tasks/{id}: câmpurile aplicate și ordinea din mesajul notificării (ai_story nu apare în mesaj)
+_TASK_NOTIFY_FIELDS = ("title", "status", "description", "priority", "complexity", "assignee", "tags")
+_TASK_PATCH_FIELDS = frozenset(_TASK_NOTIFY_FIELDS + ("ai_story",))
+
+
 @router.patch("/{task_id}", response_model=TaskRead)
 def update_task(task_id: int, data: TaskUpdate, request: Request, db: Session = Depends(get_db)):
     user_id = _get_user_id(request)
     task = _get_owned_task(db, task_id, user_id)
 
-    old_title = task.title
-    old_status = (task.status or "").lower()
-
-    if data.title is not None:
-        task.title = data.title
-    if data.description is not None:
-        task.description = data.description
-    if data.status is not None:
-        task.status = data.status
-    if data.priority is not None:
-        task.priority = data.priority
-    if data.complexity is not None:
-        task.complexity = data.complexity
-    if data.assignee is not None:
-        task.assignee = data.assignee
-    if data.tags is not None:
-        task.tags = data.tags
-    if data.ai_story is not None:
-        task.ai_story = data.ai_story
-
-    changed_bits: list[str] = []
-    if data.title is not None and data.title != old_title:
-        changed_bits.append("title")
-    if data.status is not None and (data.status or "").lower() != old_status:
-        changed_bits.append("status")
-    if data.description is not None:
-        changed_bits.append("description")
-    if data.priority is not None:
-        changed_bits.append("priority")
-    if data.complexity is not None:
-        changed_bits.append("complexity")
-    if data.assignee is not None:
-        changed_bits.append("assignee")
-    if data.tags is not None:
-        changed_bits.append("tags")
+    # câmpurile trimise și non-null (null = "nu modifica"); source nu se modifică prin PATCH
+    patch = {
+        k: v for k, v in data.model_dump(exclude_unset=True).items() if v is not None and k in _TASK_PATCH_FIELDS
+    }
+    # title / status apar în notificare doar dacă s-au schimbat efectiv; restul, dacă au fost trimise
+    current = {"title": task.title, "status": (task.status or "").lower()}
+    changed_bits = [k for k in _TASK_NOTIFY_FIELDS if k in patch and patch[k] != current.get(k)]
+
+    for field, value in patch.items():
+        setattr(task, field, value)
 
     if changed_bits:
         _notify(
@@ -410,78 +478,139 @@ def generate_ai_story(task_id: int, request: Request, db: Session = Depends(get_
     return task
 
 
+def _load_description_payload(db: Session, task_id: int, user_id: int) -> tuple[Task, Dict[str, Any]]:
+    task = _get_owned_task(db, task_id, user_id)
+    project = _get_owned_project(db, task.project_id, user_id)
+    return task, _description_payload(task, project)
+
+
+def _save_ai_description(db: Session, task: Task, user_id: int, generated: str, method: str) -> Task:
+    task.description = generated
+    task.ai_story = (task.ai_story or "") + "\n\n[AI description generated]"
+    task.source = f"ai_description:{method}"
+
+    _notify(
+        db,
+        user_id=user_id,
+        ntype="ai_description_generated",
+        title="AI description generated",
+        message=f"AI description generated for: {task.title}",
+        project_id=task.project_id,
+        task_id=task.id,
+    )
+
+    db.commit()
+    db.refresh(task)
+    return task
+
+
 @router.post("/{task_id}/ai-description", response_model=TaskRead)
-def generate_ai_description(task_id: int, request: Request, db: Session = Depends(get_db)):
+async def generate_ai_description(task_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    async: apelul AI nu ține un thread din threadpool cât așteaptă după OpenAI.
+    Lucrul cu sesiunea (sync) rulează în threadpool.
+    """
     user_id = _get_user_id(request)
     _ai_enabled_or_503()
 
-    task = _get_owned_task(db, task_id, user_id)
-    project = _get_owned_project(db, task.project_id, user_id)
-
-    payload = {
-        "title": task.title,
-        "description": task.description,
-        "project_name": project.name if project else None,
-        "project_description": project.description if project else None,
-        "tech_stack": getattr(project, "tech_stack", None) if project else None,
-        "infrastructure": getattr(project, "infrastructure", None) if project else None,
-        "priority": task.priority,
-        "complexity": task.complexity,
-        "assignee": task.assignee,
-        "tags": task.tags,
-    }
+    task, payload = await run_in_threadpool(_load_description_payload, db, task_id, user_id)
+    project_id = task.project_id
 
     ai_service = AIService()
 
     try:
-        generated = ai_service.generate_description(payload)
+        generated = await ai_service.generate_description_async(payload)
         method = "openai" if ai_service.provider == "openai" else ai_service.provider
     except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError) as exc:
         logger.warning(
             "ai_description_failed_fallback_placeholder",
-            extra={"task_id": task_id, "project_id": task.project_id, "error": str(exc)},
+            extra={"task_id": task_id, "project_id": project_id, "error": str(exc)},
         )
-        generated = _fallback_placeholder_description(payload)
+        generated = await run_in_threadpool(_fallback_placeholder_description, payload)
         method = "placeholder"
     except Exception as exc:
         logger.warning(
             "ai_description_unknown_failed_fallback_placeholder",
-            extra={"task_id": task_id, "project_id": task.project_id, "error": str(exc)},
+            extra={"task_id": task_id, "project_id": project_id, "error": str(exc)},
         )
-        generated = _fallback_placeholder_description(payload)
+        generated = await run_in_threadpool(_fallback_placeholder_description, payload)
         method = "placeholder"
 
-    task.description = generated
-    task.ai_story = (task.ai_story or "") + "\n\n[AI description generated]"
-    task.source = f"ai_description:{method}"
+    return await run_in_threadpool(_save_ai_description, db, task, user_id, generated, method)
 
-    _notify(
-        db,
-        user_id=user_id,
-        ntype="ai_description_generated",
-        title="AI description generated",
-        message=f"AI description generated for: {task.title}",
-        project_id=task.project_id,
-        task_id=task.id,
-    )
 
-    db.commit()
-    db.refresh(task)
-    return task
+def _description_stream_done(task_id: int, user_id: int, state: Dict[str, Any]) -> None:
+    """
+    Rulează după ultimul chunk (background-ul StreamingResponse), cu sesiune proprie.
+    Descrierea se salvează doar dacă stream-ul a ajuns la final.
+    """
+    if not state.get("done"):
+        return
+    db = SessionLocal()
+    try:
+        task = db.get(Task, task_id)
+        if task is not None:
+            _save_ai_description(db, task, user_id, state["text"], state["method"])
+    except Exception:
+        db.rollback()
+        logger.exception("ai_description_stream_save_failed", extra={"task_id": task_id})
+    finally:
+        db.close()
 
 
-# =========================================================
-# AI DESCRIPTION (batch)
-# =========================================================
-@router.post("/ai/generate-descriptions", response_model=list[TaskRead])
-def generate_descriptions_batch(
-    req: GenerateDescriptionsRequest, request: Request, db: Session = Depends(get_db)
-):
+@router.post("/{task_id}/ai-description/stream")
+async def stream_ai_description(task_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Aceeași descriere ca POST /{task_id}/ai-description, trimisă ca Server-Sent Events:
+    `data: {"chunk": ...}` pentru fiecare bucată, apoi `event: done`.
+    Task-ul se actualizează după ce s-a trimis ultimul chunk.
+    """
     user_id = _get_user_id(request)
     _ai_enabled_or_503()
 
+    _, payload = await run_in_threadpool(_load_description_payload, db, task_id, user_id)
+    state: Dict[str, Any] = {"done": False}
+
+    async def events():
+        ai_service = AIService()
+        method = ai_service.provider
+        parts: List[str] = []
+        try:
+            async for chunk in ai_service.stream_description(payload):
+                parts.append(chunk)
+                yield sse_event({"chunk": chunk})
+        except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError) as exc:
+            if parts:
+                # clientul are deja o parte din text; nu amestecăm cu placeholder-ul
+                logger.warning("ai_description_stream_failed", extra={"task_id": task_id, "error": str(exc)})
+                yield sse_event({"detail": "AI provider failure"}, event="error")
+                return
+            logger.warning(
+                "ai_description_failed_fallback_placeholder", extra={"task_id": task_id, "error": str(exc)}
+            )
+            method = "placeholder"
+            parts = [await run_in_threadpool(_fallback_placeholder_description, payload)]
+            yield sse_event({"chunk": parts[0]})
+
+        state.update(done=True, text="".join(parts), method=method)
+        yield sse_event({"task_id": task_id, "method": method}, event="done")
+
+    return StreamingResponse(
+        events(),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+        background=BackgroundTask(_description_stream_done, task_id, user_id, state),
+    )
+
+
+# =========================================================
+# AI DESCRIPTION (batch)
+# =========================================================
+def _load_description_batch(
+    db: Session, req: GenerateDescriptionsRequest, user_id: int
+) -> List[tuple[Task, Dict[str, Any]]]:
     # ✅ ownership check
-    _get_owned_project(db, req.project_id, user_id)
+    project = _get_owned_project(db, req.project_id, user_id)
 
     q = db.query(Task).filter(Task.project_id == req.project_id)
 
@@ -497,72 +626,83 @@ def generate_descriptions_batch(
     if not tasks:
         raise HTTPException(status_code=404, detail="No tasks found for the given scope")
 
-    project = db.get(Project, req.project_id)
-    ai_service = AIService()
-    updated: list[Task] = []
-
-    for task in tasks:
-        payload = {
-            "title": task.title,
-            "description": task.description,
-            "project_name": project.name if project else None,
-            "project_description": project.description if project else None,
-            "tech_stack": getattr(project, "tech_stack", None) if project else None,
-            "infrastructure": getattr(project, "infrastructure", None) if project else None,
-            "priority": task.priority,
-            "complexity": task.complexity,
-            "assignee": task.assignee,
-            "tags": task.tags,
-        }
+    return [(task, _description_payload(task, project)) for task in tasks]
 
-        try:
-            generated = ai_service.generate_description(payload)
-            method = "openai" if ai_service.provider == "openai" else ai_service.provider
-        except Exception:
-            generated = _fallback_placeholder_description(payload)
-            method = "placeholder"
 
+def _save_description_batch(
+    db: Session,
+    req: GenerateDescriptionsRequest,
+    user_id: int,
+    items: List[tuple[Task, Dict[str, Any]]],
+    outs: List[tuple[str, str]],
+) -> List[TaskRead]:
+    notifications: list[Dict[str, Any]] = []
+
+    for (task, _), (generated, method) in zip(items, outs):
         task.description = generated
         task.ai_story = (task.ai_story or "") + "\n\n[AI description generated]"
         task.source = f"ai_description:{method}"
-        updated.append(task)
 
-        _notify(
-            db,
-            user_id=user_id,
-            ntype="ai_description_generated",
-            title="AI description generated",
-            message=f"AI description generated for: {task.title}",
-            project_id=task.project_id,
-            task_id=task.id,
+        notifications.append(
+            _notification_row(
+                user_id=user_id,
+                ntype="ai_description_generated",
+                title="AI description generated",
+                message=f"AI description generated for: {task.title}",
+                project_id=task.project_id,
+                task_id=task.id,
+            )
         )
 
-    _notify(
-        db,
-        user_id=user_id,
-        ntype="ai_batch_done",
-        title="AI batch complete",
-        message=f"AI generated descriptions for {len(updated)} task(s).",
-        project_id=req.project_id,
+    notifications.append(
+        _notification_row(
+            user_id=user_id,
+            ntype="ai_batch_done",
+            title="AI batch complete",
+            message=f"AI generated descriptions for {len(items)} task(s).",
+            project_id=req.project_id,
+        )
     )
+    queue_notifications(db, notifications)
 
     db.commit()
-    return updated
+    # serializat aici (threadpool): după commit atributele se reîncarcă din DB
+    return [TaskRead.model_validate(task) for task, _ in items]
 
 
-# =========================================================
-# AI EFFORT ESTIMATION (single)
-# =========================================================
-@router.post("/{task_id}/estimate", response_model=EffortEstimateResponse)
-def estimate_effort(
-    task_id: int,
-    request: Request,
-    req: Optional[EffortEstimateRequest] = None,
-    db: Session = Depends(get_db),
+@router.post("/ai/generate-descriptions", response_model=list[TaskRead])
+async def generate_descriptions_batch(
+    req: GenerateDescriptionsRequest, request: Request, db: Session = Depends(get_db)
 ):
+    """
+    Descrierile pentru toate task-urile se generează în paralel (asyncio.gather), nu una după alta.
+    DB-ul (citire / salvare) rulează în threadpool.
+    """
     user_id = _get_user_id(request)
     _ai_enabled_or_503()
 
+    items = await run_in_threadpool(_load_description_batch, db, req, user_id)
+
+    ai_service = AIService()
+    results = await ai_service.generate_descriptions_batch_async([payload for _, payload in items])
+
+    outs: List[tuple[str, str]] = []
+    for (_, payload), result in zip(items, results):
+        if isinstance(result, BaseException):
+            generated = await run_in_threadpool(_fallback_placeholder_description, payload)
+            outs.append((generated, "placeholder"))
+        else:
+            outs.append((result, ai_service.provider))
+
+    return await run_in_threadpool(_save_description_batch, db, req, user_id, items, outs)
+
+
+# =========================================================
+# AI EFFORT ESTIMATION (single)
+# =========================================================
+def _load_estimate_payload(
+    db: Session, task_id: int, user_id: int, req: Optional[EffortEstimateRequest]
+) -> tuple[Task, Dict[str, Any]]:
     task = _get_owned_task(db, task_id, user_id)
 
     if (task.status or "").lower() == "done":
@@ -576,26 +716,14 @@ def estimate_effort(
 
     project = _get_owned_project(db, task.project_id, user_id)
 
-    history_text = _build_history_text(db, task.project_id, task.id, max_history_tasks) if include_history else None
+    history_text = _build_history_text(db, task.project_id, (task.id,), max_history_tasks) if include_history else None
 
-    payload = {
-        "title": task.title,
-        "description": task.description,
-        "project_name": project.name if project else None,
-        "project_description": project.description if project else None,
-        "tech_stack": getattr(project, "tech_stack", None) if project else None,
-        "infrastructure": getattr(project, "infrastructure", None) if project else None,
-        "history": history_text,
-        "scale": "Fibonacci 1,2,3,5,8,13,21",
-    }
+    return task, _estimate_payload(task, project, history_text)
 
-    try:
-        out = AIService().estimate_effort(payload)
-    except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError):
-        out = _fallback_placeholder_estimate(payload)
-    except Exception:
-        out = _fallback_placeholder_estimate(payload)
 
+def _save_estimate(db: Session, task: Task, user_id: int, out: Dict[str, Any]) -> EffortEstimateResponse:
+    task_id = task.id
+    project_id = task.project_id
     try:
         task.estimated_story_points = int(out["story_points"])
         task.ai_confidence = float(out.get("confidence", 0.0))
@@ -615,7 +743,7 @@ def estimate_effort(
         db.refresh(task)
     except Exception:
         db.rollback()
-        logger.exception("ai_estimate_db_error", extra={"task_id": task_id, "project_id": task.project_id})
+        logger.exception("ai_estimate_db_error", extra={"task_id": task_id, "project_id": project_id})
         raise HTTPException(status_code=500, detail="Failed to persist estimate to database")
 
     return EffortEstimateResponse(
@@ -628,61 +756,93 @@ def estimate_effort(
     )
 
 
-# =========================================================
-# AI EFFORT ESTIMATION (batch)
-# =========================================================
-@router.post("/ai/estimate-effort", response_model=list[EffortEstimateResponse])
-def estimate_effort_all(req: EstimateEffortBatchRequest, request: Request, db: Session = Depends(get_db)):
+@router.post("/{task_id}/estimate", response_model=EffortEstimateResponse)
+async def estimate_effort(
+    task_id: int,
+    request: Request,
+    req: Optional[EffortEstimateRequest] = None,
+    db: Session = Depends(get_db),
+):
     user_id = _get_user_id(request)
     _ai_enabled_or_503()
 
-    _get_owned_project(db, req.project_id, user_id)
+    task, payload = await run_in_threadpool(_load_estimate_payload, db, task_id, user_id, req)
+
+    try:
+        out = await AIService().estimate_effort_async(payload)
+    except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError):
+        out = await run_in_threadpool(_fallback_placeholder_estimate, payload)
+    except Exception:
+        out = await run_in_threadpool(_fallback_placeholder_estimate, payload)
+
+    return await run_in_threadpool(_save_estimate, db, task, user_id, out)
+
+
+# =========================================================
+# AI EFFORT ESTIMATION (batch)
+# =========================================================
+def _load_estimate_batch(
+    db: Session, req: EstimateEffortBatchRequest, user_id: int
+) -> tuple[List[tuple[Task, Dict[str, Any]]], Optional[str]]:
+    """
+    Task-urile de estimat + un singur istoric la nivel de proiect (fără task-urile din batch),
+    comun pentru tot batch-ul: o interogare, nu câte una per task.
+    """
+    project = _get_owned_project(db, req.project_id, user_id)
 
     tasks = db.query(Task).filter(Task.project_id == req.project_id).all()
     if not tasks:
         raise HTTPException(status_code=404, detail="No tasks found for project")
 
-    project = db.get(Project, req.project_id)
-    responses: list[EffortEstimateResponse] = []
-    ai_service = AIService()
+    items: List[tuple[Task, Dict[str, Any]]] = [
+        (task, _estimate_payload(task, project, None))
+        for task in tasks
+        if (task.status or "").lower() != "done"
+    ]
 
-    updated_count = 0
+    history_text = None
+    if req.include_history and items:
+        batch_ids = [task.id for task, _ in items]
+        history_text = _build_history_text(db, req.project_id, batch_ids, req.max_history_tasks)
+    return items, history_text
 
-    for task in tasks:
-        if (task.status or "").lower() == "done":
-            continue
 
-        history_text = _build_history_text(db, req.project_id, task.id, req.max_history_tasks) if req.include_history else None
+async def _estimate_or_fallback(ai_service: AIService, payload: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return await ai_service.estimate_effort_async(payload)
+    except Exception:
+        fallback = AIService()
+        fallback.provider = "placeholder"
+        return await fallback.estimate_effort_async(payload)
 
-        payload = {
-            "title": task.title,
-            "description": task.description,
-            "project_name": project.name if project else None,
-            "project_description": project.description if project else None,
-            "tech_stack": getattr(project, "tech_stack", None) if project else None,
-            "infrastructure": getattr(project, "infrastructure", None) if project else None,
-            "history": history_text,
-            "scale": "Fibonacci 1,2,3,5,8,13,21",
-        }
 
-        try:
-            out = ai_service.estimate_effort(payload)
-        except Exception:
-            out = _fallback_placeholder_estimate(payload)
+def _save_estimate_batch(
+    db: Session,
+    req: EstimateEffortBatchRequest,
+    user_id: int,
+    items: List[tuple[Task, Dict[str, Any]]],
+    outs: List[Dict[str, Any]],
+) -> List[EffortEstimateResponse]:
+    responses: list[EffortEstimateResponse] = []
+    notifications: list[Dict[str, Any]] = []
 
+    updated_count = 0
+
+    for (task, _), out in zip(items, outs):
         try:
             task.estimated_story_points = int(out["story_points"])
             task.ai_confidence = float(out.get("confidence", 0.0))
             task.source = str(out.get("method", "unknown"))
 
-            _notify(
-                db,
-                user_id=user_id,
-                ntype="ai_estimate_done",
-                title="AI estimate ready",
-                message=f"{task.title}: SP={task.estimated_story_points}",
-                project_id=task.project_id,
-                task_id=task.id,
+            notifications.append(
+                _notification_row(
+                    user_id=user_id,
+                    ntype="ai_estimate_done",
+                    title="AI estimate ready",
+                    message=f"{task.title}: SP={task.estimated_story_points}",
+                    project_id=task.project_id,
+                    task_id=task.id,
+                )
             )
 
             updated_count += 1
@@ -701,30 +861,69 @@ def estimate_effort_all(req: EstimateEffortBatchRequest, request: Request, db: S
             db.rollback()
             continue
 
-    _notify(
-        db,
-        user_id=user_id,
-        ntype="ai_batch_done",
-        title="AI batch complete",
-        message=f"AI effort estimation completed for {updated_count} task(s).",
-        project_id=req.project_id,
+    notifications.append(
+        _notification_row(
+            user_id=user_id,
+            ntype="ai_batch_done",
+            title="AI batch complete",
+            message=f"AI effort estimation completed for {updated_count} task(s).",
+            project_id=req.project_id,
+        )
     )
+    queue_notifications(db, notifications)
 
     db.commit()
     return responses
 
 
-# =========================================================
-# AI PROJECT SUMMARY
-# =========================================================
-@router.post("/ai/project-summary", response_model=ProjectSummaryResponse)
-def create_project_summary(req: ProjectSummaryRequest, request: Request, db: Session = Depends(get_db)):
+@router.post("/ai/estimate-effort", response_model=list[EffortEstimateResponse])
+async def estimate_effort_all(req: EstimateEffortBatchRequest, request: Request, db: Session = Depends(get_db)):
+    """
+    Toate task-urile se estimează printr-un singur prompt (JSON array, câte AI_ESTIMATE_BATCH_SIZE),
+    nu un request per task. Dacă răspunsul batch nu e valid, estimările rulează per task în paralel
+    (asyncio.gather). DB-ul (citire / salvare) rulează în threadpool.
+    """
     user_id = _get_user_id(request)
     _ai_enabled_or_503()
 
-    _get_owned_project(db, req.project_id, user_id)
+    items, history_text = await run_in_threadpool(_load_estimate_batch, db, req, user_id)
+
+    ai_service = AIService()
+    payloads = [payload for _, payload in items]
+    try:
+        outs = await ai_service.estimate_effort_batch_async(payloads, history=history_text)
+    except AIServiceError as exc:
+        logger.warning("ai_estimate_batch_failed_per_task", extra={"project_id": req.project_id, "error": str(exc)})
+        outs = await asyncio.gather(
+            *(_estimate_or_fallback(ai_service, {**payload, "history": history_text}) for payload in payloads)
+        )
+
+    return await run_in_threadpool(_save_estimate_batch, db, req, user_id, items, list(outs))
 
-    q = db.query(Task).filter(Task.project_id == req.project_id)
+
+# =========================================================
+# AI PROJECT SUMMARY
+# =========================================================
+def _load_summary_payload(db: Session, req: ProjectSummaryRequest, user_id: int) -> Dict[str, Any]:
+    project = _get_owned_project(db, req.project_id, user_id)
+
+    # doar coloanele citite de _task_to_summary_item (fără description / ai_story)
+    q = (
+        db.query(Task)
+        .options(
+            load_only(
+                Task.id,
+                Task.title,
+                Task.status,
+                Task.priority,
+                Task.complexity,
+                Task.assignee,
+                Task.tags,
+                Task.estimated_story_points,
+            )
+        )
+        .filter(Task.project_id == req.project_id)
+    )
 
     if req.task_ids is not None:
         if len(req.task_ids) == 0:
@@ -736,9 +935,7 @@ def create_project_summary(req: ProjectSummaryRequest, request: Request, db: Ses
 
     tasks = q.order_by(desc(Task.created_at)).all()
 
-    project = db.get(Project, req.project_id)
-
-    payload = {
+    return {
         "project_name": getattr(project, "name", None),
         "project_description": getattr(project, "description", None),
         "tech_stack": getattr(project, "tech_stack", None),
@@ -746,31 +943,56 @@ def create_project_summary(req: ProjectSummaryRequest, request: Request, db: Ses
         "tasks": [_task_to_summary_item(t) for t in tasks],
     }
 
+
+def _summary_notification_job(project_id: int, user_id: int) -> None:
+    """
+    Rulează după trimiterea răspunsului (BackgroundTasks), cu sesiune proprie:
+    sesiunea request-ului e deja închisă.
+    """
+    try:
+        with SessionLocal() as db:
+            _notify(
+                db,
+                user_id=user_id,
+                ntype="ai_project_summary",
+                title="AI project summary",
+                message=f"AI project summary generated for project_id={project_id}",
+                project_id=project_id,
+            )
+            db.commit()
+    except Exception:
+        logger.exception("ai_project_summary_notification_failed", extra={"project_id": project_id})
+
+
+@router.post("/ai/project-summary", response_model=ProjectSummaryResponse)
+async def create_project_summary(
+    req: ProjectSummaryRequest,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    user_id = _get_user_id(request)
+    _ai_enabled_or_503()
+
+    payload = await run_in_threadpool(_load_summary_payload, db, req, user_id)
+
     ai_service = AIService()
 
     try:
-        summary_text = ai_service.generate_project_summary(payload)
+        summary_text = await ai_service.generate_project_summary_async(payload)
         method = "openai" if ai_service.provider == "openai" else ai_service.provider
     except (AIServiceTimeoutError, AIServiceInvalidResponseError, AIServiceError):
-        summary_text = _fallback_placeholder_project_summary(payload)
+        summary_text = await run_in_threadpool(_fallback_placeholder_project_summary, payload)
         method = "placeholder"
     except Exception:
-        summary_text = _fallback_placeholder_project_summary(payload)
+        summary_text = await run_in_threadpool(_fallback_placeholder_project_summary, payload)
         method = "placeholder"
 
-    _notify(
-        db,
-        user_id=user_id,
-        ntype="ai_project_summary",
-        title="AI project summary",
-        message=f"AI project summary generated for project_id={req.project_id}",
-        project_id=req.project_id,
-    )
-
-    db.commit()
+    # notificarea nu e necesară pentru răspuns -> se scrie după ce răspunsul a plecat
+    background_tasks.add_task(_summary_notification_job, req.project_id, user_id)
 
     return ProjectSummaryResponse(
         project_id=req.project_id,
         summary=summary_text,
         method=method,
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,88 @@
+# backend/tests/test_pagination.py
+"""
+Keyset pagination (backend/pagination.py) pe un tabel SQLite in-memory:
+rânduri cu created_at NULL și rânduri cu același created_at (tie-break pe id).
+
+Rulare: python -m unittest discover -s backend/tests -t .
+"""
+import unittest
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from backend.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    keyset_order_by,
+    next_cursor_headers,
+)
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=True)
+
+
+T1 = datetime(2024, 1, 1, 10, 0, 0)
+T2 = datetime(2024, 1, 2, 10, 0, 0)
+
+# id -> created_at: NULL-uri amestecate printre id-uri, plus tie-uri pe T1 / T2
+ROWS = {1: T1, 2: None, 3: T2, 4: T1, 5: None, 6: T2, 7: T1, 8: None}
+
+
+class KeysetPaginationTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = Session(self.engine)
+        self.db.add_all([Row(id=i, created_at=ts) for i, ts in ROWS.items()])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _paginate(self, descending, limit):
+        seen, cursor = [], None
+        for _ in range(len(ROWS) + 2):
+            stmt = select(Row).order_by(*keyset_order_by(Row.created_at, Row.id, descending))
+            if cursor is not None:
+                stmt = stmt.where(keyset_filter(Row.created_at, Row.id, cursor, descending))
+            rows = self.db.scalars(stmt.limit(limit)).all()
+            seen += [r.id for r in rows]
+            cursor = next_cursor_headers(rows, limit).get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                return seen
+        self.fail("pagination did not terminate")
+
+    def _expected(self, descending):
+        # grupul NULL primul în ambele direcții; tie-break pe id în aceeași direcție
+        nulls = sorted((i for i in ROWS if ROWS[i] is None), reverse=descending)
+        dated = sorted((i for i in ROWS if ROWS[i] is not None), key=lambda i: (ROWS[i], i), reverse=descending)
+        return nulls + dated
+
+    def test_pages_cover_all_rows_in_order(self):
+        for descending in (True, False):
+            for limit in (1, 2, 3, len(ROWS)):
+                with self.subTest(descending=descending, limit=limit):
+                    self.assertEqual(self._paginate(descending, limit), self._expected(descending))
+
+    def test_next_cursor_for_null_created_at(self):
+        last = self.db.get(Row, 8)
+        headers = next_cursor_headers([last], limit=1)
+        self.assertEqual(headers, {NEXT_CURSOR_HEADER: "_8"})
+
+    def test_cursor_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor(T1, 4)), (T1, 4))
+        self.assertEqual(decode_cursor(encode_cursor(None, 5)), (None, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()